@@ -0,0 +1,249 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import gc
+import json
+import os
+import sys
+import time
+
+HOST = sys.implementation.name != "circuitpython"
+
+def _dirname(path: str) -> str:
+    return "/".join(path.split("/")[:-1]) or "."
+
+ROOT = _dirname(_dirname(__file__.replace("\\", "/")))
+TEXTURE = "filesystem/system/assets/outrunner_outline.bmp"
+TEXTURE_FRAMES = 76
+FONT = "filesystem/system/assets/font5x7.bmp"
+
+WARMUP = 10
+FRAME_DT = 1 / 30  # every tick advances the scene by the same time so runs are comparable
+
+def _setup() -> None:
+    if HOST:
+        sys.path.insert(0, f"{ROOT}/host")
+        import run
+        run.setup(ROOT)
+    else:
+        # the build ships `bench` next to `code.py`, which may be in a subdirectory with its own lib
+        root = "" if ROOT == "." else ROOT
+        os.chdir(root or "/")
+        sys.path.append(f"{root}/engine")
+        sys.path.append(f"{root}/lib")
+        import engine_main
+        engine_main._init()
+
+# scenes, each returns the nodes to destroy and a per-frame update function
+
+def scene_sprites(count: int) -> tuple:
+    from engine_nodes import Sprite2DNode
+    from engine_resources import TextureResource
+    texture = TextureResource(TEXTURE)
+    nodes = [
+        Sprite2DNode(
+            position=((i * 7) % 128 - 64, (i * 13) % 128 - 64),
+            texture=texture, transparent_color=0,
+            frame_count_x=TEXTURE_FRAMES, fps=30,
+        ) for i in range(count)
+    ]
+    return nodes, None
+
+def scene_rectangles(count: int) -> tuple:
+    from engine_nodes import Rectangle2DNode
+    from engine_math import Vector2
+    nodes = [
+        Rectangle2DNode(
+            position=Vector2((i * 7) % 128 - 64, (i * 13) % 128 - 64),
+            width=4 + i % 8, height=4 + i % 5, color=0xF800 >> (i % 3), outline=bool(i % 2),
+        ) for i in range(count)
+    ]
+    def update(frame: int) -> None:
+        for i, node in enumerate(nodes):
+            node.position = ((i * 7 + frame) % 128 - 64, (i * 13) % 128 - 64)
+    return nodes, update
+
+def scene_text(count: int) -> tuple:
+    from engine_nodes import Text2DNode
+    nodes = [Text2DNode(position=(0, i * 8 - 64), text="0", color=0xFFFF) for i in range(count)]
+    def update(frame: int) -> None:
+        for i, node in enumerate(nodes):
+            node.text = f"SCORE {frame * (i + 1)}"
+    return nodes, update
+
+def scene_font_text(count: int) -> tuple:
+    from engine_nodes import Text2DNode
+    from engine_resources import FontResource
+    font = FontResource(FONT)
+    nodes = [Text2DNode(position=(0, i * 8 - 64), font=font, text="0", color=0xFFFF) for i in range(count)]
+    def update(frame: int) -> None:
+        for i, node in enumerate(nodes):
+            node.text = f"SCORE {frame * (i + 1)}"
+    return nodes, update
+
+def scene_tweens(count: int) -> tuple:
+    from engine_nodes import Rectangle2DNode
+    from engine_animation import Tween, EASE_ELAST_IN_OUT
+    from engine_math import Vector2
+    nodes = []
+    tweens = []
+    for i in range(count):
+        node = Rectangle2DNode(position=(0, 0), width=4, height=4, color=0x07E0)
+        tween = Tween()
+        tween.start(node, "position", Vector2(-60, i % 128 - 64), Vector2(60, 64 - i % 128), 500 + i % 500, ease_type=EASE_ELAST_IN_OUT)
+        nodes.append(node)
+        tweens.append(tween)
+    def update(frame: int) -> None:
+        for tween in tweens:
+            if tween.finished:
+                tween.restart()
+    return nodes + tweens, update
+
+def scene_layers(count: int) -> tuple:
+    from engine_nodes import Rectangle2DNode
+    nodes = [Rectangle2DNode(position=(i % 128 - 64, 0), width=2, height=2, color=0x001F, layer=i % 128) for i in range(count)]
+    def update(frame: int) -> None:
+        for i, node in enumerate(nodes):
+            node.layer = (i + frame) % 128
+    return nodes, update
+
+def scene_level(count: int) -> tuple:
+    from engine_nodes import CameraNode, Rectangle2DNode
+    nodes = [
+        Rectangle2DNode(position=((i * 37) % (count * 16), (i * 13) % 128 - 64), width=8, height=8, color=0x07E0)
+        for i in range(count)
+    ]
+    camera = CameraNode(position=(0, 0))
+    def update(frame: int) -> None:
+        camera.position = ((frame * 4) % (count * 16), 0)
+    return nodes + [camera], update
+
+def scene_physics(count: int) -> tuple:
+    from engine_nodes import PhysicsCircle2DNode, PhysicsRectangle2DNode
+    import engine_physics
+    engine_physics.set_gravity(0, 100)
+    nodes = [
+        PhysicsRectangle2DNode(position=(0, 64), width=128, height=8, dynamic=False),
+        PhysicsRectangle2DNode(position=(-64, 0), width=8, height=128, dynamic=False),
+        PhysicsRectangle2DNode(position=(64, 0), width=8, height=128, dynamic=False),
+    ]
+    nodes += [
+        PhysicsCircle2DNode(position=((i * 7) % 112 - 56, (i * 13) % 96 - 56), velocity=((i * 17) % 40 - 20, 0), radius=2, bounciness=0.5)
+        for i in range(count)
+    ]
+    return nodes, None
+
+SCENES = (
+    ("sprites", scene_sprites, 64),
+    ("rectangles", scene_rectangles, 128),
+    ("text", scene_text, 16),
+    ("font_text", scene_font_text, 16),
+    ("tweens", scene_tweens, 64),
+    ("layers", scene_layers, 64),
+    ("level", scene_level, 512),
+    ("physics", scene_physics, 128),
+)
+
+def _run_frames(update: object, first: int, count: int, times: list, allocations: list) -> int:
+    import engine
+    peak = 0
+    for frame in range(first, first + count):
+        if update:
+            update(frame)
+        gc.collect()
+        gc.disable()
+        used = gc.mem_alloc()
+        start = time.monotonic_ns()
+        engine.tick()
+        elapsed = time.monotonic_ns() - start
+        after = gc.mem_alloc()
+        gc.enable()
+        if times is not None:
+            times.append(elapsed / 1000000)
+        if allocations is not None:
+            allocations.append(after - used)
+        peak = max(peak, after)
+    return peak
+
+def run_scene(name: str, scene: object, count: int, frames: int) -> dict:
+    import engine
+    nodes, update = scene(count)
+
+    times = []
+    allocations = []
+    _run_frames(update, 0, WARMUP, None, None)
+    if HOST:
+        # allocation tracing would dominate the frame time, so measure it in a separate pass
+        import tracemalloc
+        import engine_main
+        _run_frames(update, WARMUP, frames, times, None)
+        render = engine_main._display.render
+        engine_main._display.render = False  # compositing is host-only work
+        tracemalloc.start()
+        peak = _run_frames(update, WARMUP + frames, frames, None, allocations)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+        engine_main._display.render = render
+    else:
+        peak = _run_frames(update, WARMUP, frames, times, allocations)
+
+    for node in nodes:
+        if hasattr(node, "mark_destroy_all"):
+            node.mark_destroy_all()
+    engine.tick()
+
+    times.sort()
+    return {
+        "scene": name,
+        "count": count,
+        "frames": frames,
+        "tick_ms_mean": sum(times) / len(times),
+        "tick_ms_p95": times[(len(times) - 1) * 95 // 100],
+        "tick_ms_max": times[-1],
+        "alloc_bytes_per_frame": sum(allocations) / len(allocations),
+        "peak_heap_bytes": peak,
+    }
+
+def main(frames: int = 120, scale: float = 1, only: tuple = None, output: str = None, render: bool = True) -> list:
+    _setup()
+    import engine
+    import engine_io
+    import engine_main
+    engine.disable_fps_limit()
+    engine_io._frame_dt = FRAME_DT
+    if HOST:
+        engine_main._display.render = render
+
+    results = []
+    for name, scene, count in SCENES:
+        if only and name not in only:
+            continue
+        result = run_scene(name, scene, max(int(count * scale), 1), frames)
+        results.append(result)
+        print("{scene:>12} x{count:<4} mean {tick_ms_mean:.3f} ms, p95 {tick_ms_p95:.3f} ms, alloc {alloc_bytes_per_frame:.0f} B/frame, peak {peak_heap_bytes} B".format(**result))
+
+    data = {
+        "platform": sys.implementation.name,
+        "host": HOST,
+        "results": results,
+    }
+    if output:
+        with open(output, "w") as f:
+            json.dump(data, f)
+    else:
+        print(json.dumps(data))
+    return results
+
+if __name__ == "__main__":
+    if HOST:
+        import argparse
+        parser = argparse.ArgumentParser(description="Run the synthetic engine benchmark scenes")
+        parser.add_argument("--frames", type=int, default=120)
+        parser.add_argument("--scale", type=float, default=1, help="multiplier for the node count of each scene")
+        parser.add_argument("--scene", action="append", help="only run the named scene(s)")
+        parser.add_argument("--output", "-o", help="write results as JSON to this file")
+        parser.add_argument("--no-render", action="store_true", help="skip compositing the host framebuffer")
+        args = parser.parse_args()
+        main(args.frames, args.scale, args.scene, os.path.abspath(args.output) if args.output else None, not args.no_render)
+    else:
+        main()
@@ -22,6 +22,7 @@ ALLOWED_GAMES = [
 ]
 
 ASSET_DIRS = [
+    "bench",
     "bitmaps",
     "engine",
     "filesystem/system",
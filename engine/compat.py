@@ -2,14 +2,43 @@
 #
 # SPDX-License-Identifier: GPLv3
 import gc
+import time
 
 try:
     import ustack
 except ImportError:
     ustack = None
 
+# collect garbage during idle frame time rather than mid-frame
+_gc_watermark = 16384
+_gc_min_idle = 0.002
+_gc_count = 0
+_gc_last = 0
+_gc_max = 0
+_gc_total = 0
+
+def gc_schedule(watermark: int = 16384, min_idle: float = 0.002) -> None:
+    global _gc_watermark, _gc_min_idle
+    _gc_watermark = max(watermark, 0)
+    _gc_min_idle = max(min_idle, 0)
+
+def _idle_collect(idle: float) -> bool:
+    global _gc_count, _gc_last, _gc_max, _gc_total
+    # only collect if the previous collection would have fit in the remaining frame time
+    if not _gc_watermark or idle < _gc_min_idle or idle * 1000000 < _gc_last or gc.mem_free() >= _gc_watermark:
+        return False
+    start = time.monotonic_ns()
+    gc.collect()
+    _gc_last = (time.monotonic_ns() - start) // 1000
+    _gc_max = max(_gc_max, _gc_last)
+    _gc_total += _gc_last
+    _gc_count += 1
+    return True
+
 def mem_info(verbose: int = 0):
     if ustack:
         print(f"stack: {ustack.stack_usage()} out of {ustack.stack_size()}")
     used, free = gc.mem_alloc(), gc.mem_free()
     print(f"GC: total: {used+free}, used: {used}, free: {free}")
+    if _gc_count:
+        print(f"idle collections: {_gc_count}, last: {_gc_last}us, max: {_gc_max}us, mean: {_gc_total // _gc_count}us")
@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import bitmaptools
+import displayio
+
+import engine_main
+
+# composites the scene into a single RGB565 bitmap instead of letting displayio traverse the node tree
+
+_KEY = 0x0020  # RGB565 value reserved for transparent pixels in converted bitmaps
+_CACHE_LIMIT = 64  # converted bitmaps kept, least recently used ones are evicted beyond it
+_SMALL_PALETTE = 4  # palettes up to this size are keyed by their colors, larger ones need `invalidate`
+_PALETTE_LIMIT = 256  # small palettes whose last colors are remembered, forgotten all at once beyond it
+
+_enabled = False
+_bitmap = None
+_group = None
+_sources = {}
+_used = {}  # source key -> clock of its last use
+_clock = 0
+_palettes = {}  # (bitmap, small palette) -> colors it was last drawn with
+_transparent = {}  # ColorConverter -> transparent input color
+
+def enable() -> None:
+    global _enabled, _bitmap, _group
+    if _enabled:
+        return
+    if _bitmap is None:
+        size = engine_main._DISPLAY_SIZE
+        _bitmap = displayio.Bitmap(size, size, 65535)
+        _group = displayio.Group(x=-size//2, y=-size//2)
+        _group.append(displayio.TileGrid(
+            bitmap=_bitmap,
+            pixel_shader=displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB565),
+        ))
+    engine_main._root_group.remove(engine_main._bg_group)
+    engine_main._root_group.remove(engine_main._layer_group)
+    engine_main._root_group.append(_group)
+    _enabled = True
+    engine_main._dirty = True
+
+def disable() -> None:
+    global _enabled
+    if not _enabled:
+        return
+    engine_main._root_group.remove(_group)
+    engine_main._root_group.append(engine_main._bg_group)
+    engine_main._root_group.append(engine_main._layer_group)
+    _sources.clear()
+    _used.clear()
+    _palettes.clear()
+    _enabled = False
+    engine_main._dirty = True
+
+def _set_transparent(shader: displayio.ColorConverter, color: int) -> None:
+    _transparent[shader] = color
+
+def invalidate(source: displayio.Bitmap|displayio.Palette|displayio.ColorConverter = None) -> None:
+    # call after changing a bitmap's pixels or a large palette in place, or with no source to drop everything
+    if not _sources:
+        return
+    if source is None:
+        _sources.clear()
+        _used.clear()
+        _palettes.clear()
+    else:
+        for key in [key for key in _sources if key[0] is source or key[1] is source]:
+            del _sources[key]
+            del _used[key]
+        for key in [key for key in _palettes if key[0] is source or key[1] is source]:
+            del _palettes[key]
+    engine_main._dirty = True
+
+def _evict() -> None:
+    oldest = None
+    for key in _used:
+        if oldest is None or _used[key] < _used[oldest]:
+            oldest = key
+    del _sources[oldest]
+    del _used[oldest]
+
+def _rgb565(color: int) -> int:
+    color = ((color >> 8) & 0xF800) | ((color >> 5) & 0x07E0) | ((color >> 3) & 0x001F)
+    return color ^ 0x0001 if color == _KEY else color
+
+def _get_source(bitmap: displayio.Bitmap, shader: displayio.Palette|displayio.ColorConverter) -> displayio.Bitmap:
+    global _clock
+    palette = isinstance(shader, displayio.Palette)
+    stale = False
+    if palette and len(shader) <= _SMALL_PALETTE:
+        # nodes drawing the same bitmap in the same colors share a source, but a palette that changed since it
+        # was last drawn is probably fading, so it gets a source of its own that is converted again in place
+        colors = (bitmap,) + tuple(-1 if shader.is_transparent(i) else shader[i] for i in range(len(shader)))
+        key = (bitmap, shader)
+        last = _palettes.get(key)
+        if key in _sources or (last is not None and last != colors):
+            stale = last != colors
+        else:
+            key = colors
+        if last != colors:
+            if len(_palettes) >= _PALETTE_LIMIT:
+                _palettes.clear()
+            _palettes[(bitmap, shader)] = colors
+    else:
+        key = (bitmap, shader)
+    _clock += 1
+    if (source := _sources.get(key)) is not None and not stale:
+        _used[key] = _clock
+        return source
+
+    # convert indexed or non-RGB565 pixels once and keep the result
+    if palette:
+        table = [_KEY if shader.is_transparent(i) else _rgb565(shader[i]) for i in range(len(shader))]
+        def convert(value: int) -> int:
+            return table[value] if value < len(table) else _KEY
+    else:
+        transparent = _transparent.get(shader)
+        def convert(value: int) -> int:
+            if value == transparent:
+                return _KEY
+            value = shader.convert(value)
+            return value ^ 0x0001 if value == _KEY else value
+    if source is None:
+        if len(_sources) >= _CACHE_LIMIT:
+            _evict()
+        source = _sources[key] = displayio.Bitmap(bitmap.width, bitmap.height, 65535)
+    for i in range(bitmap.width * bitmap.height):
+        source[i] = convert(bitmap[i])
+    _used[key] = _clock
+    return source
+
+def _fill(x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    size = engine_main._DISPLAY_SIZE
+    x1, y1, x2, y2 = max(x1, 0), max(y1, 0), min(x2, size), min(y2, size)
+    if x1 < x2 and y1 < y2:
+        bitmaptools.fill_region(_bitmap, x1, y1, x2, y2, value)
+
+def _blit(source: displayio.Bitmap, x: int, y: int, x1: int, y1: int, x2: int, y2: int, scale: int) -> None:
+    size = engine_main._DISPLAY_SIZE
+    if x >= size or y >= size or x + (x2 - x1) * scale <= 0 or y + (y2 - y1) * scale <= 0:
+        return
+    if scale == 1:
+        if x < 0:
+            x1, x = x1 - x, 0
+        if y < 0:
+            y1, y = y1 - y, 0
+        x2, y2 = min(x2, x1 + size - x), min(y2, y1 + size - y)
+        bitmaptools.blit(_bitmap, source, x, y, x1=x1, y1=y1, x2=x2, y2=y2, skip_source_index=_KEY)
+    else:
+        width, height = x2 - x1, y2 - y1
+        bitmaptools.rotozoom(
+            _bitmap, source,
+            ox=x, oy=y,  # pivot on the corner so odd sizes don't round
+            dest_clip0=(max(x, 0), max(y, 0)), dest_clip1=(min(x + width * scale, size), min(y + height * scale, size)),
+            px=x1, py=y1,
+            source_clip0=(x1, y1), source_clip1=(x2, y2),
+            angle=0.0, scale=scale, skip_index=_KEY,
+        )
+
+def _draw_tilegrid(tg: displayio.TileGrid, ox: int, oy: int, scale: int) -> None:
+    shader, bitmap = tg.pixel_shader, tg.bitmap
+    tile_width, tile_height = tg.tile_width, tg.tile_height
+    x, y = ox + tg.x * scale, oy + tg.y * scale
+
+    # single color palettes (rectangles, background color) don't need their pixels read
+    if isinstance(shader, displayio.Palette) and len(shader) == 1:
+        if not shader.is_transparent(0):
+            _fill(x, y, x + tile_width * tg.width * scale, y + tile_height * tg.height * scale, _rgb565(shader[0]))
+        return
+
+    source = _get_source(bitmap, shader)
+    columns = bitmap.width // tile_width
+    for ty in range(tg.height):
+        for tx in range(tg.width):
+            tile = tg[tx, ty]
+            sx, sy = (tile % columns) * tile_width, (tile // columns) * tile_height
+            _blit(
+                source,
+                x + tx * tile_width * scale, y + ty * tile_height * scale,
+                sx, sy, sx + tile_width, sy + tile_height,
+                scale,
+            )
+
+def _draw_group(group: displayio.Group, ox: int, oy: int, scale: int) -> None:
+    if group.hidden:
+        return
+    ox += group.x * scale
+    oy += group.y * scale
+    scale *= group.scale
+    for item in group:
+        if isinstance(item, displayio.TileGrid):
+            if not item.hidden:
+                _draw_tilegrid(item, ox, oy, scale)
+        elif isinstance(item, displayio.Group):
+            _draw_group(item, ox, oy, scale)
+
+def _render() -> None:
+    # root group coordinates are centered on the game area
+    offset = engine_main._DISPLAY_SIZE // 2
+    _draw_group(engine_main._bg_group, offset, offset, 1)
+    _draw_group(engine_main._layer_group, offset, offset, 1)
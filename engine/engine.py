@@ -3,8 +3,11 @@
 # SPDX-License-Identifier: GPLv3
 import time
 
+import compat
+import compositor
 import engine_main
 import engine_io
+import profiler
 
 _fps_limit = 30
 
@@ -23,6 +26,55 @@ _fps_running_timestamp = time.monotonic()
 def get_running_fps() -> float:
     return _fps_running
 
+_fixed_step = None
+_max_frame_skip = 0
+_accumulator = 0
+_dropped_frames = 0
+
+def fixed_timestep(step: float = None, max_frame_skip: int = 4) -> None:
+    # tick nodes at a constant `step` (in seconds, defaults to the fps limit) and run up to
+    # `max_frame_skip` extra updates per rendered frame when falling behind
+    global _fixed_step, _max_frame_skip, _accumulator
+    if step is None:
+        step = 1 / _fps_limit if _fps_limit else 1 / 30
+    _fixed_step = step
+    _max_frame_skip = max(max_frame_skip, 0)
+    _accumulator = 0
+
+def disable_fixed_timestep() -> None:
+    global _fixed_step
+    _fixed_step = None
+
+def get_dropped_frames() -> int:
+    return _dropped_frames
+
+# sleep through spare frame time instead of spinning inside `display.refresh`
+_POLL_INTERVAL = 0.008  # USB full-speed HID polling interval
+_power_saving = False
+_busy_time = 0
+_idle_time = 0
+
+def power_saving(enabled: bool = True) -> None:
+    global _power_saving
+    _power_saving = enabled
+
+def get_busy_time() -> float:
+    return _busy_time
+
+def get_idle_time() -> float:
+    return _idle_time
+
+def get_load() -> float:
+    total = _busy_time + _idle_time
+    return _busy_time / total if total else 1
+
+def _idle(duration: float) -> None:
+    # keep servicing the gamepad so that short presses aren't missed while asleep
+    end = time.monotonic() + duration
+    while (remaining := end - time.monotonic()) > 0:
+        engine_io._poll()
+        time.sleep(min(remaining, _POLL_INTERVAL))
+
 _running = True
 def start() -> None:
     global _running
@@ -32,16 +84,99 @@ def end() -> None:
     global _running
     _running = False
 
+# node `_ticking` state: 0 = unregistered, 1 = ticked, 2 = pending removal
 _nodes = []
+_nodes_removed = False
 _timestamp = None
-def tick() -> bool:
-    global _timestamp, _fps_running, _fps_running_current, _fps_running_timestamp
 
-    engine_main._display.refresh(
-        target_frames_per_second=_fps_limit,
-    )
+def _add_node(node: object) -> None:
+    if not node._ticking:
+        _nodes.append(node)
+    node._ticking = 1
+
+def _remove_node(node: object) -> None:
+    global _nodes_removed
+    if node._ticking == 1:
+        node._ticking = 2
+        _nodes_removed = True
+
+def _prune_nodes() -> None:
+    global _nodes_removed
+    # compact in place to avoid allocating a new list
+    j = 0
+    for node in _nodes:
+        if node._ticking == 1:
+            _nodes[j] = node
+            j += 1
+        else:
+            node._ticking = 0
+    del _nodes[j:]
+    _nodes_removed = False
+
+# engine subsystems updated once per step before nodes, called as `system(dt)`
+_systems = []
+
+def _add_system(system: object) -> None:
+    if system not in _systems:
+        _systems.append(system)
+
+def _remove_system(system: object) -> None:
+    if system in _systems:
+        _systems.remove(system)
+
+# subsystems called as `system()` once per rendered frame, right before drawing
+_render_systems = []
+
+def _add_render_system(system: object) -> None:
+    if system not in _render_systems:
+        _render_systems.append(system)
+
+def _remove_render_system(system: object) -> None:
+    if system in _render_systems:
+        _render_systems.remove(system)
+
+def _tick_nodes(dt: float, profiling: bool) -> None:
+    # iterate backwards so systems can remove themselves
+    i = len(_systems)
+    while i:
+        i -= 1
+        _systems[i](dt)
+    if profiling:
+        profiler._tick_nodes(_nodes, dt)
+    else:
+        for node in _nodes:
+            if node._ticking == 1:
+                node.tick(dt)
+    if _nodes_removed:
+        _prune_nodes()
+
+def tick() -> bool:
+    global _timestamp, _fps_running, _fps_running_current, _fps_running_timestamp, _accumulator, _dropped_frames, _busy_time, _idle_time
+
+    profiling = profiler._enabled
+    if profiling:
+        start = time.monotonic_ns()
+    frame_start = time.monotonic()
+    idle = 0
+
+    for system in _render_systems:
+        system()
+    if engine_main._dirty:
+        if compositor._enabled:
+            compositor._render()
+        # keep the frame dirty if it was dropped by the display
+        engine_main._dirty = not engine_main._display.refresh(
+            target_frames_per_second=None if _power_saving else _fps_limit,
+        )
+    elif not _power_saving and _fps_limit is not None and _timestamp is not None:
+        idle = time_to_next_tick()
+        time.sleep(idle)  # nothing changed, just pace the frame
+    if profiling:
+        start = profiler._record(profiler.REFRESH, start)
 
     engine_io._tick()
+    if profiling:
+        start = profiler._record(profiler.INPUT, start)
     if engine_io._HOME.is_just_pressed:
         reset()
     
@@ -49,9 +184,23 @@ def tick() -> bool:
     now = time.monotonic()
     if _running and _timestamp is not None:
         dt = now - _timestamp
-        for node in _nodes:
-            node.tick(dt)
+        if engine_io._frame_dt:
+            _tick_nodes(engine_io._frame_dt, profiling)  # deterministic input recording or replay
+        elif _fixed_step:
+            _accumulator += dt
+            steps = int(_accumulator / _fixed_step)
+            if steps > _max_frame_skip + 1:
+                _dropped_frames += steps - _max_frame_skip - 1
+                steps = _max_frame_skip + 1
+            _accumulator %= _fixed_step
+            for i in range(steps):
+                _tick_nodes(_fixed_step, profiling)
+        else:
+            _tick_nodes(dt, profiling)
     _timestamp = now
+    if profiling:
+        profiler._record(profiler.NODES, start)
+        profiler._end_frame()
 
     # update running fps
     _fps_running_current += 1
@@ -60,6 +209,19 @@ def tick() -> bool:
         _fps_running_current = 0
         _fps_running_timestamp = now
 
+    # spend any slack left in the frame budget on garbage collection
+    if _fps_limit is not None:
+        compat._idle_collect(_time_left(frame_start))
+
+    busy = time.monotonic() - frame_start - idle
+    if _power_saving and _fps_limit is not None:
+        idle = _time_left(frame_start)
+        _idle(idle)
+
+    # smoothed busy and idle time per frame
+    _busy_time += (busy - _busy_time) * 0.1
+    _idle_time += (idle - _idle_time) * 0.1
+
     return _running
 
 def dt() -> float:
@@ -70,5 +232,9 @@ def time_to_next_tick() -> float:
         return 0
     return max((1 / _fps_limit) - (time.monotonic() - _timestamp), 0)
 
+def _time_left(frame_start: float) -> float:
+    # the budget is counted from the start of the frame, so work and idling add up to one frame
+    return max((1 / _fps_limit) - (time.monotonic() - frame_start), 0)
+
 def reset(soft_reset: bool = False) -> None:
     raise SystemExit  # returns to picker
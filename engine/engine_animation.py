@@ -4,6 +4,8 @@
 import math
 from micropython import const
 
+import engine
+from engine_math import Vector2, Vector3
 from engine_nodes import EmptyNode
 
 LOOP = const(1)
@@ -60,6 +62,7 @@ class Tween(EmptyNode):
 
     def __init__(self):
         super().__init__()
+        engine._remove_node(self)  # ticked only while playing
 
         self._duration = None
         self.loop_type = ONE_SHOT  # TODO: looping
@@ -69,6 +72,7 @@ class Tween(EmptyNode):
         self._attribute_name = ""
         self._start = None
         self._end = None
+        self._value = None
         self._position = None
         self._playing = False
         self._finished = False
@@ -83,6 +87,13 @@ class Tween(EmptyNode):
         else:
             self._start = start if start is not None else 0
         self._end = end if end is not None else 0
+        # copy the start so it doesn't follow the target, and interpolate into one reused vector
+        if isinstance(self._end, Vector3):
+            self._start, self._value = Vector3(0, 0, 0) + self._start, Vector3(0, 0, 0)
+        elif isinstance(self._end, Vector2):
+            self._start, self._value = Vector2(0, 0) + self._start, Vector2(0, 0)
+        else:
+            self._value = None
         self.duration = duration
         self.loop_type = loop_type
         self.ease_type = ease_type
@@ -94,6 +105,7 @@ class Tween(EmptyNode):
         self._position = 1
         self._playing = False
         self._finished = True
+        engine._remove_node(self)
         if self.after and self.loop_type is ONE_SHOT:
             if isinstance(self.after, Tween):
                 self.after.restart()
@@ -114,6 +126,7 @@ class Tween(EmptyNode):
         self._position = 0
         self._playing = True
         self._finished = False
+        engine._add_node(self)
     
     def _tween(self, position: float, start: float, end: float) -> float:
         return (end - start) * position + start
@@ -130,6 +143,19 @@ class Tween(EmptyNode):
                         self._tween(position, self._start[0], self._end[0]),
                         self._tween(position, self._start[1], self._end[1])
                     )
+                elif isinstance(self._value, Vector3):
+                    value = self._value
+                    value._set(
+                        self._tween(position, self._start.x, self._end.x),
+                        self._tween(position, self._start.y, self._end.y),
+                        self._tween(position, self._start.z, self._end.z),
+                    )
+                elif self._value is not None:
+                    value = self._value
+                    value._set(
+                        self._tween(position, self._start.x, self._end.x),
+                        self._tween(position, self._start.y, self._end.y),
+                    )
                 else:
                     value = self._tween(position, self._start, self._end)
                 if self._object:
@@ -151,6 +177,7 @@ class Delay(EmptyNode):
 
     def __init__(self):
         super().__init__()
+        engine._remove_node(self)  # ticked only while waiting
 
         self._delay = None
         self._time = None
@@ -162,12 +189,14 @@ class Delay(EmptyNode):
         self._time = 0
         self._finished = False
         self.after = after
+        engine._add_node(self)
 
     def tick(self, dt: float) -> None:
         if self._finished is False and self._delay is not None and self._delay > 0 and self._time is not None:
             self._time += dt
             if self._time >= self._delay:
                 self._finished = True
+                engine._remove_node(self)
                 if callable(self.after):
                     self.after()
 
@@ -3,41 +3,72 @@
 # SPDX-License-Identifier: GPLv3
 import audiomixer
 
+import engine
 import engine_main
 import engine_resources
 
 _CHANNELS = 4
+_IDLE_TIMEOUT = 5  # seconds without playback before the mixer and peripherals are released
 
-_mixer = audiomixer.Mixer(
-    voice_count=_CHANNELS,
-    sample_rate=engine_main._peripherals.dac.sample_rate,
-    channel_count=1,
-    bits_per_sample=8,
-    samples_signed=False,
-    buffer_size=8192,
-)
-engine_main._peripherals.audio.play(_mixer)
-
+_mixer = None
+_idle = 0
 _volume = 1
 _channels = []
+
+def _get_mixer() -> audiomixer.Mixer:
+    global _mixer, _idle
+    _idle = 0
+    if _mixer is None:
+        peripherals = engine_main._get_peripherals()
+        _mixer = audiomixer.Mixer(
+            voice_count=_CHANNELS,
+            sample_rate=peripherals.dac.sample_rate,
+            channel_count=1,
+            bits_per_sample=8,
+            samples_signed=False,
+            buffer_size=8192,
+        )
+        for channel in _channels:
+            _mixer.voice[channel._index].level = channel._gain * _volume
+            _mixer.voice[channel._index].loop = channel._loop
+        peripherals.audio.play(_mixer)
+        engine._add_system(_tick)
+    return _mixer
+
+def _tick(dt: float) -> None:
+    global _mixer, _idle
+    if _mixer.playing:
+        _idle = 0
+        return
+    _idle += dt
+    if _idle >= _IDLE_TIMEOUT:
+        engine._remove_system(_tick)
+        engine_main._peripherals.audio.stop()
+        _mixer.deinit()
+        _mixer = None
+        engine_main._release_peripherals()
+
 class AudioChannel:
     
     def __init__(self):
         self._index = len(_channels)
         _channels.append(self)
         self._gain = 1
+        self._loop = False
         self._source = None
 
     def play(self, sound_resource: engine_resources.WaveSoundResource, loop: bool = False) -> None:
         self._source = sound_resource
-        _mixer.voice[self._index].play(sound_resource._wave, loop=loop)
+        self._loop = loop
+        _get_mixer().voice[self._index].play(sound_resource._wave, loop=loop)
 
     def stop(self) -> None:
-        _mixer.voice[self._index].stop()
+        if _mixer is not None:
+            _mixer.voice[self._index].stop()
 
     @property
     def source(self) -> engine_resources.WaveSoundResource:
-        if self._source and not _mixer.voice[self._index].playing:
+        if self._source and self.done:
             self._source = None
         return self._source
     
@@ -48,7 +79,8 @@ class AudioChannel:
     @gain.setter
     def gain(self, value: float) -> None:
         self._gain = min(max(value, 0), 1)
-        _mixer.voice[self._index].level = self._gain * _volume
+        if _mixer is not None:
+            _mixer.voice[self._index].level = self._gain * _volume
     
     @property
     def time(self) -> float:
@@ -60,15 +92,17 @@ class AudioChannel:
     
     @property
     def loop(self) -> bool:
-        return _mixer.voice[self._index].loop
+        return self._loop
     
     @loop.setter
     def loop(self, value: bool) -> None:
-        _mixer.voice[self._index].loop = value
+        self._loop = value
+        if _mixer is not None:
+            _mixer.voice[self._index].loop = value
 
     @property
     def done(self) -> bool:
-        return not _mixer.voice[self._index].playing
+        return _mixer is None or not _mixer.voice[self._index].playing
 
 for i in range(_CHANNELS):
     AudioChannel()
@@ -87,8 +121,9 @@ def stop(channel_index: int) -> None:
 def set_volume(set_volume: float) -> None:
     global _volume
     _volume = set_volume
-    for i in range(_CHANNELS):
-        _mixer.voice[i].level = _channels[i]._gain * _volume
+    if _mixer is not None:
+        for i in range(_CHANNELS):
+            _mixer.voice[i].level = _channels[i]._gain * _volume
 
 def get_volume() -> float:
     return _volume
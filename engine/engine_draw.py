@@ -4,6 +4,7 @@
 from displayio import TileGrid
 
 from engine_main import _bg_group, _bg_palette
+import engine_main
 from engine_resources import TextureResource
 
 class Color:
@@ -71,6 +72,7 @@ def set_background_color(background_color: Color|int) -> None:
     if isinstance(background_color, int):
         background_color = Color(background_color)
     _bg_palette[0] = background_color._rgb888
+    engine_main._dirty = True
 
 def set_background(background: TextureResource) -> None:
     # remove everything but the background color
@@ -80,3 +82,4 @@ def set_background(background: TextureResource) -> None:
     _bg_group.append(TileGrid(
         bitmap=background._bitmap, pixel_shader=background._palette,
     ))
+    engine_main._dirty = True
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
 #
 # SPDX-License-Identifier: GPLv3
+import struct
 import supervisor
 import sys
 
@@ -27,23 +28,69 @@ _KEY_MAP = {
     "\x1b": relic_usb_host_gamepad.BUTTON_HOME,
 }
 
-_last_keys = []
-_keys = []
+# per-frame button state as bitmasks of gamepad button ids
+_pressed = 0
+_just_pressed = 0
+_just_released = 0
+_key_mask = 0
+_button_mask = 0  # buttons referenced by `Button` objects
+_polled_pressed = 0  # gamepad events received between ticks
+_polled_released = 0
 _gamepad = relic_usb_host_gamepad.Gamepad()
 
+# input recording and replay
+_MAGIC = b"TCIR"
+_VERSION = 1
+_HEADER = "<4sBf"
+_FRAME = "<III"
+_frame = bytearray(struct.calcsize(_FRAME))
+_record_file = None
+_replay_file = None
+_frame_dt = None  # fixed tick duration while recording or replaying
+
 def rumble(intensity: float) -> None:
     if _gamepad.connected and hasattr(_gamepad._device, "rumble"):
         _gamepad._device.rumble = intensity
 
-def _tick() -> None:
-    global _last_keys, _keys
+def record(filepath: str, dt: float = None) -> None:
+    global _record_file, _frame_dt
+    stop()
+    if dt is None:
+        import engine
+        dt = 1 / engine._fps_limit if engine._fps_limit else 1 / 30
+    _record_file = open(filepath, "wb")
+    _record_file.write(struct.pack(_HEADER, _MAGIC, _VERSION, dt))
+    _frame_dt = dt
 
-    # gamepad
-    _gamepad.update()
+def replay(filepath: str) -> None:
+    global _replay_file, _frame_dt
+    stop()
+    _replay_file = open(filepath, "rb")
+    magic, version, dt = struct.unpack(_HEADER, _replay_file.read(struct.calcsize(_HEADER)))
+    if magic != _MAGIC or version != _VERSION:
+        _replay_file.close()
+        _replay_file = None
+        raise ValueError("Invalid input recording")
+    _frame_dt = dt
+
+def stop() -> None:
+    global _record_file, _replay_file, _frame_dt
+    if _record_file:
+        _record_file.close()
+        _record_file = None
+    if _replay_file:
+        _replay_file.close()
+        _replay_file = None
+    _frame_dt = None
 
-    # keyboard
-    _last_keys = _keys
-    _keys = []
+def is_recording() -> bool:
+    return _record_file is not None
+
+def is_replaying() -> bool:
+    return _replay_file is not None
+
+def _read_keys() -> int:
+    mask = 0
     if (available := supervisor.runtime.serial_bytes_available) > 0:
         buffer = sys.stdin.read(available)
         while buffer:
@@ -55,19 +102,66 @@ def _tick() -> None:
                 if buffer and buffer[0] == "~":
                     key += buffer[0]
                     buffer = buffer[1:]
-            _keys.append(key.upper())
+            key = key.upper()
+            if key in _KEY_MAP:
+                mask |= 1 << _KEY_MAP[key]
+    return mask
+
+def _poll() -> None:
+    global _polled_pressed, _polled_released
+    if _replay_file:
+        return
+    _gamepad.update()
+    for event in _gamepad.events:
+        if event.pressed:
+            _polled_pressed |= 1 << event.key_number
+        else:
+            _polled_released |= 1 << event.key_number
+
+def _tick() -> None:
+    global _pressed, _just_pressed, _just_released, _key_mask, _polled_pressed, _polled_released
+
+    if _replay_file:
+        if _replay_file.readinto(_frame) == len(_frame):
+            _pressed, _just_pressed, _just_released = struct.unpack_from(_FRAME, _frame)
+            return
+        stop()  # end of recording, resume live input
+
+    # gamepad
+    _gamepad.update()
+    pressed, just_pressed, just_released = 0, _polled_pressed, _polled_released
+    _polled_pressed = _polled_released = 0
+    if _gamepad.connected:
+        for i in range(len(relic_usb_host_gamepad.BUTTON_NAMES)):
+            if (_button_mask >> i) & 1 and getattr(_gamepad.buttons, relic_usb_host_gamepad.BUTTON_NAMES[i]):
+                pressed |= 1 << i
+        for event in _gamepad.events:
+            if event.pressed:
+                just_pressed |= 1 << event.key_number
+            else:
+                just_released |= 1 << event.key_number
+
+    # keyboard, keys only register for the frame they were received
+    key_mask = _read_keys()
+    _pressed = pressed | key_mask
+    _just_pressed = just_pressed | key_mask
+    _just_released = just_released | (_key_mask & ~key_mask)
+    _key_mask = key_mask
+
+    if _record_file:
+        struct.pack_into(_FRAME, _frame, 0, _pressed, _just_pressed, _just_released)
+        _record_file.write(_frame)
 
 class Button:
 
     def __init__(self, *button_ids: int):
+        global _button_mask
         self._button_ids = button_ids
         self._button_names = tuple([relic_usb_host_gamepad.BUTTON_NAMES[i] for i in self._button_ids])
-    
-    def _check_events(self, pressed: bool = True) -> bool:
-        return _gamepad.connected and any(event.pressed is pressed and event.key_number in self._button_ids for event in _gamepad.events)
-
-    def _check_keys(self, pressed: bool = True) -> bool:
-        return _keys and any(key in _KEY_MAP and _KEY_MAP[key] in self._button_ids for key in (_keys if pressed else _last_keys))
+        self._mask = 0
+        for i in self._button_ids:
+            self._mask |= 1 << i
+        _button_mask |= self._mask
 
     @property
     def name(self) -> str:
@@ -75,15 +169,15 @@ class Button:
 
     @property
     def is_pressed(self) -> bool:
-        return any(getattr(_gamepad.buttons, x) for x in self._button_names) or self._check_keys()
+        return bool(_pressed & self._mask)
 
     @property
     def is_just_pressed(self) -> bool:
-        return self._check_events() or self._check_keys()
+        return bool(_just_pressed & self._mask)
 
     @property
     def is_just_released(self) -> bool:
-        return self._check_events(False) or self._check_keys(False)
+        return bool(_just_released & self._mask)
     
     # TODO: long pressed and double pressed?
 
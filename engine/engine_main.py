@@ -10,8 +10,11 @@ import adafruit_fruitjam
 _DISPLAY_SIZE = 128
 _LAYERS = 128
 
+_dirty = True  # set by nodes whenever the display tree changes
+_peripherals = None  # created on first use by `_get_peripherals`
+
 def _init() -> None:
-    global _config, _display, _root_group, _layer_group, _layers, _peripherals, _bg_group, _bg_palette
+    global _config, _display, _root_group, _layer_group, _layers, _layer_indices, _bg_group, _bg_palette
 
     # get Fruit Jam OS config if available
     try:
@@ -53,22 +56,53 @@ def _init() -> None:
     _layer_group = displayio.Group()
     _root_group.append(_layer_group)
     _layers = {}
+    _layer_indices = []  # sorted, matches the order of `_layer_group`
 
-    # setup audio, buttons, and neopixels
-    _peripherals = adafruit_fruitjam.peripherals.Peripherals(
-        safe_volume_limit=(_config.audio_volume_override_danger if _config else 0.75),
-        sample_rate=11025,
-    )
-    _peripherals.audio_output = _config.audio_output if _config else "headphone"
-    _peripherals.volume = _config.audio_volume if _config else 0.7
+def _get_peripherals() -> adafruit_fruitjam.peripherals.Peripherals:
+    global _peripherals
+    if _peripherals is None:
+        # setup audio, buttons, and neopixels
+        _peripherals = adafruit_fruitjam.peripherals.Peripherals(
+            safe_volume_limit=(_config.audio_volume_override_danger if _config else 0.75),
+            sample_rate=11025,
+        )
+        _peripherals.audio_output = _config.audio_output if _config else "headphone"
+        _peripherals.volume = _config.audio_volume if _config else 0.7
+    return _peripherals
+
+def _release_peripherals() -> None:
+    global _peripherals
+    if _peripherals is not None:
+        if hasattr(_peripherals, "deinit"):
+            _peripherals.deinit()
+        elif hasattr(_peripherals.audio, "deinit"):
+            _peripherals.audio.deinit()  # older releases can't release everything, but free the I2S pins
+        _peripherals = None
+
+def _bisect(index: int) -> int:
+    low, high = 0, len(_layer_indices)
+    while low < high:
+        mid = (low + high) // 2
+        if _layer_indices[mid] < index:
+            low = mid + 1
+        else:
+            high = mid
+    return low
 
 def _get_layer(index: int) -> displayio.Group:
     index = min(max(index, 0), _LAYERS-1)
-    if index not in _layers:
+    if (layer := _layers.get(index)) is None:
         layer = displayio.Group()
         _layers[index] = layer
-        _layer_group.append(layer)
-        _layer_group.sort(key=lambda x: next(i for i, layer in _layers.items() if layer == x))  # ensure that layers are in order
-        return layer
-    else:
-        return _layers[index]
+        position = _bisect(index)
+        _layer_indices.insert(position, index)
+        _layer_group.insert(position, layer)  # keep layers in order
+    return layer
+
+def _release_layer(index: int) -> None:
+    # drop empty layers so that they aren't traversed during refresh
+    if (layer := _layers.get(index)) is not None and not len(layer):
+        position = _bisect(index)
+        del _layer_indices[position]
+        _layer_group.pop(position)
+        del _layers[index]
@@ -4,50 +4,87 @@
 import math
 
 class Vector3:
+    __slots__ = ("_x", "_y", "_z", "_on_change")
 
     def __init__(self, x: float, y: float, z: float):
-        self.x, self.y, self.z = x, y, z
+        self._x, self._y, self._z = x, y, z
+        self._on_change = None  # set by the node which owns this vector
+
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._x = value
+        if self._on_change is not None:
+            self._on_change()
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._y = value
+        if self._on_change is not None:
+            self._on_change()
+
+    @property
+    def z(self) -> float:
+        return self._z
+
+    @z.setter
+    def z(self, value: float) -> None:
+        self._z = value
+        if self._on_change is not None:
+            self._on_change()
+
+    def _set(self, x: float, y: float, z: float) -> None:
+        self._x, self._y, self._z = x, y, z
+        if self._on_change is not None:
+            self._on_change()
 
     def length(self) -> float:
-        return math.sqrt(pow(self.x, 2) + pow(self.y, 2) + pow(self.z, 2))
+        return math.sqrt(pow(self._x, 2) + pow(self._y, 2) + pow(self._z, 2))
     
     def normalized(self) -> Vector3:
         length = self.length()
-        return Vector3(self.x / length, self.y / length, self.z / length)
+        return Vector3(self._x / length, self._y / length, self._z / length)
     
-    def __sub__(self, other: Vector2|Vector3|tuple) -> Vector3:
-        x, y, z = self.x, self.y, self.z
+    def __isub__(self, other: Vector2|Vector3|tuple) -> Vector3:
         if isinstance(other, (Vector2, Vector3)):
-            x -= other.x
-            y -= other.y
-            z -= other.z if isinstance(other, Vector3) else 0
+            self._set(self._x - other.x, self._y - other.y, self._z - (other.z if isinstance(other, Vector3) else 0))
         elif isinstance(other, tuple) and len(other) >= 2:
-            x -= other[0]
-            y -= other[1]
-            z -= other[2] if len(other) >= 3 else 0
+            self._set(self._x - other[0], self._y - other[1], self._z - (other[2] if len(other) >= 3 else 0))
         else:
             raise NotImplementedError()
-        return Vector3(x, y, z)
+        return self
     
-    def __add__(self, other: Vector2|Vector3|tuple) -> Vector3:
-        x, y, z = self.x, self.y, self.z
+    def __iadd__(self, other: Vector2|Vector3|tuple) -> Vector3:
         if isinstance(other, (Vector2, Vector3)):
-            x += other.x
-            y += other.y
-            z += other.z if isinstance(other, Vector3) else 0
+            self._set(self._x + other.x, self._y + other.y, self._z + (other.z if isinstance(other, Vector3) else 0))
         elif isinstance(other, tuple) and len(other) >= 2:
-            x += other[0]
-            y += other[1]
-            z += other[2] if len(other) >= 3 else 0
+            self._set(self._x + other[0], self._y + other[1], self._z + (other[2] if len(other) >= 3 else 0))
         else:
             raise NotImplementedError()
-        return Vector3(x, y, z)
+        return self
+    
+    def __imul__(self, other: float|int) -> Vector3:
+        self._set(self._x * other, self._y * other, self._z * other)
+        return self
+    
+    def __sub__(self, other: Vector2|Vector3|tuple) -> Vector3:
+        return Vector3(self._x, self._y, self._z).__isub__(other)
+    
+    def __add__(self, other: Vector2|Vector3|tuple) -> Vector3:
+        return Vector3(self._x, self._y, self._z).__iadd__(other)
     
     def __mul__(self, other: float|int) -> Vector3:
-        return Vector3(self.x * other, self.y * other, self.z * other)
+        return Vector3(self._x * other, self._y * other, self._z * other)
     
     def __div__(self, other: float|int) -> Vector3:
-        return Vector3(self.x / other, self.y / other, self.z / other)
+        return Vector3(self._x / other, self._y / other, self._z / other)
     
     def __eq__(self, other: Vector3|tuple) -> bool:
         if isinstance(other, tuple) and 2 <= len(other) <= 3:
@@ -57,64 +94,95 @@ class Vector3:
             x, y, z = other.x, other.y, other.z
         else:
             raise NotImplementedError()
-        return self.x == x and self.y == y and self.z == z
+        return self._x == x and self._y == y and self._z == z
     
     def __str__(self) -> str:
-        return f"({self.x}, {self.y}, {self.z})"
+        return f"({self._x}, {self._y}, {self._z})"
     
 class Vector2:
+    __slots__ = ("_x", "_y", "_on_change")
 
     def __init__(self, x: float, y: float):
-        self.x, self.y = x, y
+        self._x, self._y = x, y
+        self._on_change = None  # set by the node which owns this vector
+
+    @property
+    def x(self) -> float:
+        return self._x
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._x = value
+        if self._on_change is not None:
+            self._on_change()
+
+    @property
+    def y(self) -> float:
+        return self._y
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._y = value
+        if self._on_change is not None:
+            self._on_change()
+
+    def _set(self, x: float, y: float) -> None:
+        self._x, self._y = x, y
+        if self._on_change is not None:
+            self._on_change()
 
     def length(self) -> float:
-        return math.sqrt(pow(self.x, 2) + pow(self.y, 2))
+        return math.sqrt(pow(self._x, 2) + pow(self._y, 2))
     
     def normalized(self) -> Vector3:
         length = self.length()
-        return Vector2(self.x / length, self.y / length)
+        return Vector2(self._x / length, self._y / length)
     
-    def __sub__(self, other: Vector2|tuple) -> Vector2:
-        x, y = self.x, self.y
+    def __isub__(self, other: Vector2|tuple) -> Vector2:
         if isinstance(other, Vector2):
-            x -= other.x
-            y -= other.y
+            self._set(self._x - other._x, self._y - other._y)
         elif isinstance(other, tuple) and len(other) == 2:
-            x -= other[0]
-            y -= other[1]
+            self._set(self._x - other[0], self._y - other[1])
         else:
             raise NotImplementedError()
-        return Vector2(x, y)
+        return self
     
-    def __add__(self, other: Vector2|tuple) -> Vector2:
-        x, y = self.x, self.y
+    def __iadd__(self, other: Vector2|tuple) -> Vector2:
         if isinstance(other, Vector2):
-            x += other.x
-            y += other.y
+            self._set(self._x + other._x, self._y + other._y)
         elif isinstance(other, tuple) and len(other) == 2:
-            x += other[0]
-            y += other[1]
+            self._set(self._x + other[0], self._y + other[1])
         else:
             raise NotImplementedError()
-        return Vector2(x, y)
+        return self
+    
+    def __imul__(self, other: float|int) -> Vector2:
+        self._set(self._x * other, self._y * other)
+        return self
+    
+    def __sub__(self, other: Vector2|tuple) -> Vector2:
+        return Vector2(self._x, self._y).__isub__(other)
+    
+    def __add__(self, other: Vector2|tuple) -> Vector2:
+        return Vector2(self._x, self._y).__iadd__(other)
     
     def __mul__(self, other: float|int) -> Vector2:
-        return Vector2(self.x * other, self.y * other)
+        return Vector2(self._x * other, self._y * other)
     
     def __div__(self, other: float|int) -> Vector2:
-        return Vector2(self.x / other, self.y / other)
+        return Vector2(self._x / other, self._y / other)
     
     def __eq__(self, other: Vector2|tuple) -> bool:
         if isinstance(other, tuple) and len(other) == 2:
             x, y = other
         elif isinstance(other, Vector2):
-            x, y = other.x, other.y
+            x, y = other._x, other._y
         else:
             raise NotImplementedError()
-        return self.x == x and self.y == y
+        return self._x == x and self._y == y
     
     def __str__(self) -> str:
-        return f"({self.x}, {self.y})"
+        return f"({self._x}, {self._y})"
 
 class Rectangle:
 
@@ -1,61 +1,122 @@
 # SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
 #
 # SPDX-License-Identifier: GPLv3
+import bitmaptools
 import displayio
+import math
 
 from adafruit_display_text.label import Label
 
+import compositor
 from engine_main import _LAYERS, _get_layer, _layer_group
 import engine
+import engine_main
+import engine_physics
 from engine_math import Vector2, Vector3, Rectangle
-from engine_resources import TextureResource, FontResource
+from engine_resources import TextureResource, FontResource, _blend, _bitmap_cache
 from engine_draw import Color
 
-def _get_vector3(value: Vector2|Vector3|tuple|float|int) -> Vector3:
-    if isinstance(value, Vector3):
-        return value
+def _set_vector(vector: Vector2|Vector3, value: Vector2|Vector3|tuple|float|int) -> None:
+    # nodes own their vectors, so assignments copy components instead of allocating
+    if value is vector:
+        return
+    elif isinstance(value, (Vector2, Vector3)):
+        x, y = value.x, value.y
+        z = value.z if isinstance(value, Vector3) else 0
     elif isinstance(value, tuple):
-        if len(value) == 2:
-            value = value + (0,)
-        return Vector3(*value)
-    elif isinstance(value, Vector2):
-        return Vector3(value.x, value.y, 0)
+        x = value[0]
+        y = value[1] if len(value) > 1 else 0
+        z = value[2] if len(value) > 2 else 0
     elif isinstance(value, (float, int)):
-        return Vector3(float(value), float(value), 0)
+        x = y = float(value)
+        z = 0
     else:
-        return Vector3(0, 0, 0)
-
-def _get_vector2(value: Vector2|tuple|float|int) -> Vector2:
-    if isinstance(value, Vector2):
-        return value
-    elif isinstance(value, tuple):
-        if len(value) == 1:
-            value = value + (0,)
-        return Vector2(*value)
-    elif isinstance(value, (float, int)):
-        return Vector2(float(value), float(value))
+        x = y = z = 0
+    if isinstance(vector, Vector3):
+        vector._set(x, y, z)
     else:
-        return Vector2(0, 0)
+        vector._set(x, y)
     
 def _get_color(value: Color|int) -> Color:
     if isinstance(value, int):
         return Color(value)
     return value
 
+_TAU = 2 * math.pi
+
+# sprite rotation, fractional scale and opacity are quantized so generated frames can be cached and shared
+_rotation_steps = 32
+_SCALE_STEPS = 8
+_OPACITY_STEPS = 8
+
+def set_rotation_steps(steps: int) -> None:
+    global _rotation_steps
+    _rotation_steps = max(int(steps), 1)
+
+# opt-in recycling of displayio objects from destroyed nodes, keyed by shape
+_pool_limit = 0
+_pools = {}
+
+def set_pool_limit(limit: int) -> None:
+    global _pool_limit
+    _pool_limit = max(limit, 0)
+    if not _pool_limit:
+        _pools.clear()
+
+def clear_pools() -> None:
+    _pools.clear()
+
+def _pool_get(key: object) -> object:
+    if pool := _pools.get(key):
+        return pool.pop()
+    return None
+
+def _pool_put(key: object, item: object) -> bool:
+    if not _pool_limit:
+        return False
+    if (pool := _pools.get(key)) is None:
+        pool = _pools[key] = []
+    if len(pool) >= _pool_limit:
+        return False
+    pool.append(item)
+    return True
+
 class EmptyNode:
+    _scale = None
 
     def __init__(self, position: Vector2|Vector3|tuple = None, rotation: Vector2|Vector3|tuple = None, layer: int = 0):
         self._layer = None
         self._children = []
+        self._ticking = 0
+
+        # world transform, recomputed on demand once invalidated
+        self._parent_node = None
+        self._transform_dirty = True
+        self._global_x, self._global_y = 0, 0
+        self._global_rotation = 0
+        self._global_scale_x, self._global_scale_y = 1, 1
+        self._global_position = None
+        self._global_scale = None
+
+        self._position = self._make_position()
+        self._rotation = Vector3(0, 0, 0)
+        self._rotation._on_change = self._invalidate
 
         self.position = position
         self.rotation = rotation
         self.layer = layer
         
-        engine._nodes.append(self)
+        # only nodes which override `tick` need to be ticked by the engine
+        if type(self).tick is not EmptyNode.tick:
+            engine._add_node(self)
 
     def add_child(self, child: EmptyNode) -> None:
+        if child._parent_node is not None:
+            child._parent_node.remove_child(child)
         self._children.append(child)
+        child._parent_node = self
+        child._invalidate()
+        child._cull_move()
 
     def get_child(self, index: int) -> EmptyNode:
         return self._children[index]
@@ -70,24 +131,76 @@ class EmptyNode:
     def mark_destroy(self) -> None:
         if len(self._children):
             raise ValueError("children not empty")
+        engine._remove_node(self)
 
     def mark_destroy_children(self) -> None:
         while len(self._children):
-            self.remove_child(self._children[len(self._children)-1])
+            child = self._children[len(self._children)-1]
+            self.remove_child(child)
+            child.mark_destroy_all()
 
     def remove_child(self, child) -> None:
         self._children.remove(child)
+        child._parent_node = None
+        child._invalidate()
+        child._cull_move()
 
     def tick(self, dt: float) -> None:
         pass
 
+    def _make_position(self) -> Vector3:
+        position = Vector3(0, 0, 0)
+        position._on_change = self._update_position
+        return position
+
+    def _update_position(self) -> None:
+        self._invalidate()
+        self._cull_move()
+
+    def _cull_move(self) -> None:
+        # empty nodes aren't indexed, but the groups below them move with them
+        if _indexing:
+            for child in self._children:
+                child._cull_move()
+
+    def _invalidate(self) -> None:
+        # descendants of a dirty node are always dirty, so the walk stops at the first one
+        if self._transform_dirty:
+            return
+        self._transform_dirty = True
+        for child in self._children:
+            child._invalidate()
+
+    def _update_transform(self) -> None:
+        parent = self._parent_node
+        if parent is None:
+            x, y, rotation, scale_x, scale_y = 0, 0, 0, 1, 1
+        else:
+            if parent._transform_dirty:
+                parent._update_transform()
+            x, y, rotation = parent._global_x, parent._global_y, parent._global_rotation
+            scale_x, scale_y = parent._global_scale_x, parent._global_scale_y
+
+        # displayio groups can't rotate their children, so rotation doesn't move them
+        self._global_x = x + self._position.x * scale_x
+        self._global_y = y + self._position.y * scale_y
+        local_rotation = self._rotation
+        if isinstance(local_rotation, Vector3):
+            local_rotation = local_rotation.z
+        self._global_rotation = rotation + (local_rotation or 0)
+        if self._scale is not None:
+            scale_x *= self._scale.x
+            scale_y *= self._scale.y
+        self._global_scale_x, self._global_scale_y = scale_x, scale_y
+        self._transform_dirty = False
+
     @property
     def position(self) -> Vector3:
         return self._position
     
     @position.setter
     def position(self, value: Vector2|Vector3|tuple) -> None:
-        self._position = _get_vector3(value)
+        _set_vector(self._position, value)
 
     @property
     def rotation(self) -> Vector3:
@@ -95,7 +208,34 @@ class EmptyNode:
     
     @rotation.setter
     def rotation(self, value: Vector2|Vector3|tuple) -> None:
-        self._rotation = _get_vector3(value)
+        _set_vector(self._rotation, value)
+
+    @property
+    def global_position(self) -> Vector2|Vector3:
+        if self._transform_dirty:
+            self._update_transform()
+        if self._global_position is None:
+            self._global_position = Vector3(0, 0, 0) if isinstance(self._position, Vector3) else Vector2(0, 0)
+        if isinstance(self._global_position, Vector3):
+            self._global_position._set(self._global_x, self._global_y, self._position.z)
+        else:
+            self._global_position._set(self._global_x, self._global_y)
+        return self._global_position
+
+    @property
+    def global_rotation(self) -> float:
+        if self._transform_dirty:
+            self._update_transform()
+        return self._global_rotation
+
+    @property
+    def global_scale(self) -> Vector2:
+        if self._transform_dirty:
+            self._update_transform()
+        if self._global_scale is None:
+            self._global_scale = Vector2(0, 0)
+        self._global_scale._set(self._global_scale_x, self._global_scale_y)
+        return self._global_scale
 
     def _set_layer(self, value: int) -> None:
         self._layer = min(max(value, 0), _LAYERS-1)
@@ -108,40 +248,334 @@ class EmptyNode:
     def layer(self, value: int) -> None:
         self._set_layer(value)
 
+# groups are bucketed by the world bounds of their own content into a uniform grid once a camera or an
+# `engine_physics` query needs it, each frame the camera only visits the cells in view and hides the outermost
+# groups which have nothing left in it
+_CULL_CELL = 32
+_CULL_CELLS = 8192  # cells per axis, keeps keys small integers
+
+_camera = None
+_cameras = []  # the newest camera drives the view, older ones take over when it's destroyed
+_view = [0, 0, 0, 0]  # visible area of layer space
+_indexing = False
+_cull_nodes = []  # every group that can be indexed, so indexing can start at any time
+_cull_dirty = []
+_cull_cells = {}
+_cull_visible = []  # outermost groups which were in view last frame
+_cull_spare = []
+_cull_hidden = []  # outermost groups hidden by the camera, may hold stale entries
+_cull_bounds = [0, 0, 0, 0]
+_cull_frame = 0
+_query_frame = 0
+
+def _cull_cell(value: float) -> int:
+    return min(max(int(value // _CULL_CELL) + _CULL_CELLS // 2, 0), _CULL_CELLS - 1)
+
+def _measure(group: displayio.Group, x: int, y: int, scale: int, bounds: list, children: list = None) -> None:
+    # groups of child nodes are skipped, they're indexed on their own
+    for item in group:
+        if item.hidden:
+            continue
+        if children and _is_child_group(item, children):
+            continue
+        if isinstance(item, displayio.TileGrid):
+            x1, y1 = x + item.x * scale, y + item.y * scale
+            x2, y2 = x1 + item.tile_width * item.width * scale, y1 + item.tile_height * item.height * scale
+            bounds[0], bounds[1] = min(bounds[0], x1), min(bounds[1], y1)
+            bounds[2], bounds[3] = max(bounds[2], x2), max(bounds[3], y2)
+        elif isinstance(item, displayio.Group):
+            _measure(item, x + item.x * scale, y + item.y * scale, scale * item.scale, bounds)
+
+def _is_child_group(item: object, children: list) -> bool:
+    for child in children:
+        if getattr(child, "_group", None) is item:
+            return True
+    return False
+
+def _cull_root(node: _GroupNode) -> _GroupNode:
+    # the outermost group a node is drawn in, groups below empty nodes sit directly in their layer
+    while isinstance(node._parent_node, _GroupNode):
+        node = node._parent_node
+    return node
+
+def _set_culled(node: _GroupNode, culled: bool) -> None:
+    if node._culled != culled and node._group is not None:
+        node._culled = culled
+        node._update_hidden()
+
+def _set_camera(camera: CameraNode) -> None:
+    global _camera
+    if camera is _camera:
+        return
+    enabled = _camera is not None
+    _camera = camera
+    if camera is not None:
+        camera._update_view()
+        if not enabled:
+            engine._add_render_system(_cull)
+            if _indexing:
+                # reconsider everything on the first frame
+                for node in _cull_nodes:
+                    _cull_visible.append(_cull_root(node))
+            else:
+                _start_index()
+    elif enabled:
+        # without a camera the scene is drawn unmoved again
+        _layer_group.x, _layer_group.y, _layer_group.scale = 0, 0, 1
+        engine_main._dirty = True
+        engine._remove_render_system(_cull)
+        for node in _cull_hidden:
+            _set_culled(node, False)
+        _cull_hidden.clear()
+        _cull_visible.clear()
+
+def _start_index() -> None:
+    global _indexing
+    if not _indexing:
+        _indexing = True
+        for node in _cull_nodes:
+            node._cull_touch()
+
+def _update_index() -> None:
+    # groups which moved or changed size are reindexed, and reconsidered by the camera
+    while _cull_dirty:
+        node = _cull_dirty.pop()
+        node._cull_pending = False
+        if node._cull_slot >= 0:
+            node._cull_index()
+            if _camera is not None:
+                _cull_visible.append(_cull_root(node))
+
+def _query(x0: float, y0: float, x1: float, y1: float, results: list) -> None:
+    # appends every indexed group whose bounds overlap the area, a point query passes the same corners twice
+    global _query_frame
+    _start_index()
+    _update_index()
+    _query_frame += 1
+    frame = _query_frame
+    for cx in range(_cull_cell(x0), _cull_cell(x1) + 1):
+        for cy in range(_cull_cell(y0), _cull_cell(y1) + 1):
+            if (cell := _cull_cells.get(cx * _CULL_CELLS + cy)) is None:
+                continue
+            for node in cell:
+                if node._query_seen != frame and node._cull_x1 > x0 and node._cull_x0 <= x1 and node._cull_y1 > y0 and node._cull_y0 <= y1:
+                    node._query_seen = frame
+                    results.append(node)
+
+def _query_pairs(pairs: list) -> None:
+    # each overlapping pair is reported once, from the first cell the two share
+    _start_index()
+    _update_index()
+    for key in _cull_cells:
+        cell = _cull_cells[key]
+        cx, cy = key // _CULL_CELLS, key % _CULL_CELLS
+        for i in range(len(cell) - 1):
+            a = cell[i]
+            for j in range(i + 1, len(cell)):
+                b = cell[j]
+                if a._cull_x1 > b._cull_x0 and a._cull_x0 < b._cull_x1 and a._cull_y1 > b._cull_y0 and a._cull_y0 < b._cull_y1 and max(a._cull_range[0], b._cull_range[0]) == cx and max(a._cull_range[1], b._cull_range[1]) == cy:
+                    pairs.append(a)
+                    pairs.append(b)
+
+def _cull() -> None:
+    global _cull_frame, _cull_visible, _cull_spare
+    _camera._update_view()
+    _update_index()
+
+    _cull_frame += 1
+    frame = _cull_frame
+    visible = _cull_spare
+    x0, y0, x1, y1 = _view
+    for cx in range(_cull_cell(x0), _cull_cell(x1) + 1):
+        for cy in range(_cull_cell(y0), _cull_cell(y1) + 1):
+            if (cell := _cull_cells.get(cx * _CULL_CELLS + cy)) is None:
+                continue
+            for node in cell:
+                if node._cull_seen != frame and node._cull_x1 > x0 and node._cull_x0 < x1 and node._cull_y1 > y0 and node._cull_y0 < y1:
+                    node._cull_seen = frame
+                    # anything in view keeps the outermost group it's drawn in visible
+                    if (root := _cull_root(node)) is node or root._cull_seen != frame:
+                        root._cull_seen = frame
+                        visible.append(root)
+                        _set_culled(root, False)
+
+    # anything visible last frame but not seen in this one has left the view
+    for node in _cull_visible:
+        if node._cull_seen != frame and not node._culled and node._group is not None and not isinstance(node._parent_node, _GroupNode):
+            _set_culled(node, True)
+            _cull_hidden.append(node)
+    _cull_visible.clear()
+    _cull_visible, _cull_spare = visible, _cull_visible
+    if len(_cull_hidden) > 2 * len(_cull_nodes) + 32:
+        _cull_hidden[:] = [node for node in _cull_hidden if node._culled]
+
 class CameraNode(EmptyNode):
 
     def __init__(self, position: Vector2|Vector3|tuple = None, zoom: float = 1, viewport: Rectangle = None, rotation: Vector3|tuple = None, fov: float = 0, view_distance: float = 0, layer: int = 0):
+        self._zoom = zoom
+        self._viewport = viewport
         super().__init__(position, rotation, layer)
-        self.zoom = zoom
-        self.viewport = viewport
         self.fov = fov
         self.view_distance = view_distance
+        _cameras.append(self)
+        _set_camera(self)
+
+    def _update_position(self) -> None:
+        super()._update_position()
+        if self is _camera:
+            self._update_view()
+
+    def _update_view(self) -> None:
+        # the camera position is centered in the viewport, displayio can only zoom by whole numbers
+        if self._transform_dirty:
+            self._update_transform()
+        scale = max(int(self._zoom), 1)
+        size = engine_main._DISPLAY_SIZE
+        if (viewport := self._viewport) is not None:
+            vx, vy, vw, vh = viewport.x, viewport.y, viewport.width, viewport.height
+        else:
+            vx, vy, vw, vh = 0, 0, size, size
+        x = int(vx + vw / 2 - size // 2 - self._global_x * scale)
+        y = int(vy + vh / 2 - size // 2 - self._global_y * scale)
+        if _layer_group.x != x or _layer_group.y != y or _layer_group.scale != scale:
+            _layer_group.x, _layer_group.y, _layer_group.scale = x, y, scale
+            engine_main._dirty = True
+        _view[0] = (vx - size // 2 - x) / scale
+        _view[1] = (vy - size // 2 - y) / scale
+        _view[2] = (vx + vw - size // 2 - x) / scale
+        _view[3] = (vy + vh - size // 2 - y) / scale
+
+    def mark_destroy(self) -> None:
+        super().mark_destroy()
+        if self in _cameras:
+            _cameras.remove(self)
+        if self is _camera:
+            _set_camera(_cameras[-1] if _cameras else None)
 
     @property
-    def position(self) -> Vector3:
-        return self._position
+    def zoom(self) -> float:
+        return self._zoom
     
-    @position.setter
-    def position(self, value: Vector2|Vector3|tuple) -> None:
-        self._position = _get_vector3(value)
-        _layer_group.x = -self._position.x * _layer_group.scale
-        _layer_group.y = -self._position.y * _layer_group.scale
+    @zoom.setter
+    def zoom(self, value: float) -> None:
+        self._zoom = value
+        if self is _camera:
+            self._update_view()
+
+    @property
+    def viewport(self) -> Rectangle:
+        return self._viewport
+    
+    @viewport.setter
+    def viewport(self, value: Rectangle) -> None:
+        self._viewport = value
+        if self is _camera:
+            self._update_view()
 
 class _GroupNode(EmptyNode):
 
     def __init__(self, position: Vector2|tuple = None, rotation: float = None, scale: Vector2 = None, opacity: float = 1, layer: int = 0):
         self._parent = None
-        self._group = displayio.Group()
+        self._group = _pool_get(displayio.Group)
+        if self._group is None:
+            self._group = displayio.Group()
+        self._culled = False
+        self._cull_slot = -1  # index in `_cull_nodes`, negative when the group can't be culled
+        self._cull_pending = self._cull_indexed = False
+        self._cull_seen = self._query_seen = 0
+        self._cull_x0 = self._cull_y0 = self._cull_x1 = self._cull_y1 = 0
+        self._cull_range = None
         super().__init__(position, rotation, layer)
-        self.scale = scale
+        self._scale = Vector2(0, 0)
+        self._scale._on_change = self._update_scale
+        self.scale = scale if scale is not None else 1
         self.opacity = opacity
+        self._cull_slot = len(_cull_nodes)
+        _cull_nodes.append(self)
+        self._cull_touch()
 
-    def _set_layer(self, value: int) -> None:
-        if self._parent and self._group in self._parent:
+    def _cull_touch(self) -> None:
+        # queue the group to be reindexed before the next frame is drawn
+        if _indexing and self._cull_slot >= 0 and not self._cull_pending:
+            self._cull_pending = True
+            _cull_dirty.append(self)
+
+    def _cull_move(self) -> None:
+        self._cull_touch()
+        super()._cull_move()
+
+    def _cull_index(self) -> None:
+        # nested groups are offset by every group they're drawn in
+        group, bounds = self._group, _cull_bounds
+        x, y, scale = group.x, group.y, group.scale
+        parent = self._parent_node
+        while isinstance(parent, _GroupNode):
+            x, y = parent._group.x + x * parent._group.scale, parent._group.y + y * parent._group.scale
+            scale *= parent._group.scale
+            parent = parent._parent_node
+        if parent is not None:
+            # empty nodes aren't drawn in, the groups below them are placed by their world transform
+            if parent._transform_dirty:
+                parent._update_transform()
+            x, y = parent._global_x + x * parent._global_scale_x, parent._global_y + y * parent._global_scale_y
+            scale *= parent._global_scale_x
+        bounds[0] = bounds[2] = x
+        bounds[1] = bounds[3] = y
+        _measure(group, x, y, scale, bounds, self._children)
+        self._cull_x0, self._cull_y0, self._cull_x1, self._cull_y1 = bounds
+        cells = (_cull_cell(bounds[0]), _cull_cell(bounds[1]), _cull_cell(bounds[2]), _cull_cell(bounds[3]))
+        if self._cull_indexed and cells == self._cull_range:
+            return
+        self._cull_unindex()
+        for cx in range(cells[0], cells[2] + 1):
+            for cy in range(cells[1], cells[3] + 1):
+                if (cell := _cull_cells.get(key := cx * _CULL_CELLS + cy)) is None:
+                    cell = _cull_cells[key] = []
+                cell.append(self)
+        self._cull_range = cells
+        self._cull_indexed = True
+
+    def _cull_unindex(self) -> None:
+        if not self._cull_indexed:
+            return
+        cells = self._cull_range
+        for cx in range(cells[0], cells[2] + 1):
+            for cy in range(cells[1], cells[3] + 1):
+                cell = _cull_cells[key := cx * _CULL_CELLS + cy]
+                cell.remove(self)
+                if not cell:
+                    del _cull_cells[key]
+        self._cull_indexed = False
+
+    def _cull_remove(self) -> None:
+        # takes a destroyed group, or one indexed elsewhere, out of the grid
+        _set_culled(self, False)
+        if self._cull_slot < 0:
+            return
+        last = _cull_nodes.pop()
+        if last is not self:
+            _cull_nodes[self._cull_slot] = last
+            last._cull_slot = self._cull_slot
+        self._cull_slot = -1
+        self._cull_unindex()
+
+    def _update_hidden(self) -> None:
+        self._group.hidden = self._culled or self._opacity <= 0.01
+        engine_main._dirty = True
+
+    def _detach(self) -> None:
+        if self._parent is not None and self._group in self._parent:
             self._parent.remove(self._group)
+            if self._layer is not None:
+                engine_main._release_layer(self._layer)
+        self._parent = None
+
+    def _set_layer(self, value: int) -> None:
+        self._detach()
         super()._set_layer(value)
         self._parent = _get_layer(self._layer)
         self._parent.append(self._group)
+        engine_main._dirty = True
 
     @property
     def scale(self) -> Vector2:
@@ -149,18 +583,27 @@ class _GroupNode(EmptyNode):
     
     @scale.setter
     def scale(self, value: Vector2|tuple) -> None:
-        self._scale = _get_vector2(value)
+        _set_vector(self._scale, value)
+
+    def _update_scale(self) -> None:
+        self._invalidate()
         self._group.scale = max(int(self._scale.x), 1)
+        self._cull_move()
+        engine_main._dirty = True
 
-    @property
-    def position(self) -> Vector2:
-        return self._position
-    
-    @position.setter
-    def position(self, value: Vector3|tuple) -> None:
-        self._position = _get_vector2(value)
+    def _is_integer_scale(self) -> bool:
+        return self._scale.x >= 1 and self._scale.x == int(self._scale.x)
+
+    def _make_position(self) -> Vector2:
+        position = Vector2(0, 0)
+        position._on_change = self._update_position
+        return position
+
+    def _update_position(self) -> None:
+        super()._update_position()
         self._group.x = int(self._position.x)
         self._group.y = int(self._position.y)
+        engine_main._dirty = True
 
     @property
     def rotation(self) -> float:
@@ -169,29 +612,44 @@ class _GroupNode(EmptyNode):
     @rotation.setter
     def rotation(self, value: float) -> None:
         self._rotation = value
+        self._update_rotation()
+
+    def _update_rotation(self) -> None:
+        self._invalidate()
 
     def add_child(self, child: EmptyNode) -> None:
         super().add_child(child)
         if hasattr(child, "_group"):
-            if child._parent and child._group in child._parent:
-                child._parent.remove(child._group)
+            _set_culled(child, False)  # only outermost groups are hidden by the camera
+            child._detach()
             child._parent = self._group
             self._group.append(child._group)
+            engine_main._dirty = True
     
     def mark_destroy(self) -> None:
         super().mark_destroy()
+        if self._group is None:
+            return
+        self._cull_remove()
+        self._release()
         while len(self._group):
             self._group.pop()
-        if self._group in self._parent:
-            self._parent.remove(self._group)
-            self._parent = None
+        self._detach()
+        self._group.x, self._group.y, self._group.scale, self._group.hidden = 0, 0, 1, False
+        _pool_put(displayio.Group, self._group)
         self._group = None
+        engine_main._dirty = True
+
+    def _release(self) -> None:
+        # return pooled displayio objects before the group is cleared
+        pass
 
     def remove_child(self, child) -> None:
         super().remove_child(child)
         if hasattr(child, "_group") and child._group in self._group:
             self._group.remove(child._group)
             child._parent = None
+            engine_main._dirty = True
 
     @property
     def opacity(self) -> float:
@@ -202,9 +660,77 @@ class _GroupNode(EmptyNode):
         if value is None:
             value = 0
         self._opacity = value
-        self._group.hidden = self._opacity <= 0.01
+        self._update_hidden()
+        self._update_opacity()
+        engine_main._dirty = True
 
-    # TODO: global_position
+    def _update_opacity(self) -> None:
+        pass
+
+# sprites playing at the same fps share one clock, advanced together by an engine system
+class _AnimationClock:
+
+    def __init__(self, fps: float):
+        self.fps = fps
+        self.duration = 1 / fps
+        self.time = 0
+        self.sprites = []
+
+_animation_clocks = []
+
+def _get_animation_clock(fps: float) -> _AnimationClock:
+    for clock in _animation_clocks:
+        if clock.fps == fps:
+            return clock
+    if not _animation_clocks:
+        engine._add_system(_tick_animations)
+    clock = _AnimationClock(fps)
+    _animation_clocks.append(clock)
+    return clock
+
+def _tick_animations(dt: float) -> None:
+    # indexed loops tolerate sprites leaving or joining from completion callbacks
+    i = 0
+    while i < len(_animation_clocks):
+        clock = _animation_clocks[i]
+        if not clock.sprites:
+            _animation_clocks.pop(i)  # nothing plays at this fps anymore
+            continue
+        i += 1
+        clock.time += dt
+        if clock.time < clock.duration:
+            continue
+        steps = int(clock.time / clock.duration)
+        clock.time -= steps * clock.duration
+
+        sprites = clock.sprites
+        j = len(sprites)
+        while j:
+            j -= 1
+            sprite = sprites[j]
+            count_x = sprite._frame_count_x
+            count = count_x * sprite._frame_count_y
+            frame = sprite._frame_current_y * count_x + sprite._frame_current_x + steps
+            finished = False
+            if frame >= count:
+                if sprite.loop:
+                    frame %= count
+                else:
+                    frame, finished = count - 1, True
+            sprite._frame_current_x = frame % count_x
+            sprite._frame_current_y = frame // count_x
+            tg = sprite._tg
+            if tg is not None and not tg.hidden:
+                tg[0] = frame
+                engine_main._dirty = True
+            else:
+                sprite._update_frame()
+            if finished:
+                sprite.playing = False
+                if sprite.after is not None:
+                    sprite.after()
+    if not _animation_clocks:
+        engine._remove_system(_tick_animations)
 
 class Sprite2DNode(_GroupNode):
 
@@ -213,45 +739,128 @@ class Sprite2DNode(_GroupNode):
         self._frame_count_y = frame_count_y
         self._frame_current_x = 0
         self._frame_current_y = 0
+        self._clock = None
+        self._playing = False
+        self._fps = 0
         self._tg = None
+        self._variant_tg = None
         self._texture = None
         self._transparent_color = None
+        self._shader, self._transparent = None, None
 
         super().__init__(position, rotation, scale, opacity, layer)
 
-        self.playing = playing
         self.loop = loop
+        self.after = None  # called when a non-looping animation reaches its last frame
         self.fps = fps
+        self.playing = playing
 
         self.transparent_color = transparent_color
         self.texture = texture
 
     def _make_tg(self) -> bool:
-        if self._tg or not self._texture or not self._frame_count_x or not self._frame_count_y or not self._transparent_color:
+        if self._tg or not self._texture:
             return False
+        if not self._frame_count_x:
+            self._frame_count_x = 1
+        if not self._frame_count_y:
+            self._frame_count_y = 1
         
-        self._tg = displayio.TileGrid(
-            bitmap=self._texture._bitmap, pixel_shader=self._texture._palette,
-            width=1, height=1,
-            tile_width=self._texture.width//self._frame_count_x,
-            tile_height=self._texture.height//self._frame_count_y,
-            default_tile=(self._frame_current_y*self._frame_count_x)+self._frame_current_x,
-        )
+        self._shader, self._transparent = self._texture._get_shader(self._transparent_color)
+        tile_width = self._texture.width//self._frame_count_x
+        tile_height = self._texture.height//self._frame_count_y
+        tile = (self._frame_current_y*self._frame_count_x)+self._frame_current_x
+        if (tg := _pool_get((self._texture._bitmap, tile_width, tile_height))) is not None:
+            tg.pixel_shader = self._shader
+            tg[0] = tile
+            self._tg = tg
+        else:
+            self._tg = displayio.TileGrid(
+                bitmap=self._texture._bitmap, pixel_shader=self._shader,
+                width=1, height=1,
+                tile_width=tile_width,
+                tile_height=tile_height,
+                default_tile=tile,
+            )
         self._tg.x = -self._tg.tile_width//2
         self._tg.y = -self._tg.tile_height//2
         self._group.append(self._tg)
+        self._update_frame()
 
-        if isinstance(self._texture._palette, displayio.ColorConverter) and self._transparent_color:
-            try:
-                self._texture._palette.make_transparent(self._transparent_color._rgb565)
-            except RuntimeError:  # prevents multiple transparent color error
-                pass
-        elif isinstance(self._texture._palette, displayio.Palette) and self._transparent_color:
-            for i in range(len(self._texture._palette)):
-                if self._transparent_color and self._texture._palette[i] == self._transparent_color._rgb888:
-                    self._texture._palette.make_transparent(i)
-                else:
-                    self._texture._palette.make_opaque(i)
+    def _update_frame(self) -> None:
+        if not self._tg or self._group.hidden:
+            return
+        step = round(self._rotation / _TAU * _rotation_steps) % _rotation_steps if self._rotation else 0
+        scale = 1
+        if self._is_integer_scale():
+            self._group.scale = int(self._scale.x)
+        else:
+            self._group.scale = 1
+            scale = max(round(self._scale.x * _SCALE_STEPS), 1) / _SCALE_STEPS
+        opacity = 1 if self._opacity >= 1 else max(round(self._opacity * _OPACITY_STEPS), 1) / _OPACITY_STEPS
+        background = engine_main._bg_palette[0]
+
+        # indexed textures fade through a palette variant, others need faded pixels
+        palette = self._texture._get_palette(self._shader, opacity, background)
+        if isinstance(palette, displayio.Palette):
+            opacity = 1
+
+        if step or scale != 1 or opacity != 1:
+            # a generated frame is looked up in the shared cache and swapped in as a single tile
+            tile_width, tile_height = self._tg.tile_width, self._tg.tile_height
+            bitmap = self._texture._get_frame(
+                self._frame_current_x * tile_width, self._frame_current_y * tile_height,
+                tile_width, tile_height,
+                step * _TAU / _rotation_steps, scale, opacity, background,
+                self._transparent,
+            )
+            if self._variant_tg is not None and (self._variant_tg.bitmap.width != bitmap.width or self._variant_tg.bitmap.height != bitmap.height):
+                self._group.remove(self._variant_tg)
+                self._variant_tg = None
+            if self._variant_tg is None:
+                self._variant_tg = displayio.TileGrid(
+                    bitmap=bitmap, pixel_shader=palette,
+                    x=-bitmap.width//2, y=-bitmap.height//2,
+                )
+                self._group.append(self._variant_tg)
+            else:
+                self._variant_tg.bitmap = bitmap
+                self._variant_tg.pixel_shader = palette
+                self._variant_tg.hidden = False
+            self._tg.hidden = True
+        else:
+            self._tg[0] = self._frame_current_y * self._frame_count_x + self._frame_current_x
+            self._tg.pixel_shader = palette
+            self._tg.hidden = False
+            if self._variant_tg is not None:
+                self._variant_tg.hidden = True
+        self._cull_touch()
+        engine_main._dirty = True
+
+    def _update_rotation(self) -> None:
+        super()._update_rotation()
+        self._update_frame()
+
+    def _update_scale(self) -> None:
+        super()._update_scale()
+        self._update_frame()
+
+    def _update_hidden(self) -> None:
+        # frames aren't generated while hidden, opacity changes also land here
+        super()._update_hidden()
+        self._update_frame()
+
+    def _release(self) -> None:
+        self._playing = False
+        self._schedule()
+        if self._variant_tg:
+            self._group.remove(self._variant_tg)
+            self._variant_tg = None
+        if self._tg:
+            self._tg.hidden = False
+            self._group.remove(self._tg)
+            _pool_put((self._tg.bitmap, self._tg.tile_width, self._tg.tile_height), self._tg)
+            self._tg = None
 
     @property
     def texture(self) -> TextureResource:
@@ -261,6 +870,7 @@ class Sprite2DNode(_GroupNode):
     def texture(self, value: TextureResource) -> None:
         self._texture = value
         self._make_tg()
+        self._schedule()
     
     @property
     def transparent_color(self) -> Color:
@@ -269,7 +879,11 @@ class Sprite2DNode(_GroupNode):
     @transparent_color.setter
     def transparent_color(self, value: Color|int) -> None:
         self._transparent_color = _get_color(value)
-        self._make_tg()
+        if self._tg:
+            self._shader, self._transparent = self._texture._get_shader(self._transparent_color)
+            self._update_frame()
+        else:
+            self._make_tg()
 
     @property
     def frame_count_x(self) -> int:
@@ -296,8 +910,7 @@ class Sprite2DNode(_GroupNode):
     @frame_current_x.setter
     def frame_current_x(self, value: int) -> None:
         self._frame_current_x = value % self._frame_count_x if self._frame_count_x else 0
-        if self._tg:
-            self._tg[0] = (self._frame_current_y * self._frame_count_x) + self._frame_current_x if self._frame_count_x else 0
+        self._update_frame()
 
     @property
     def frame_current_y(self) -> int:
@@ -306,8 +919,7 @@ class Sprite2DNode(_GroupNode):
     @frame_current_y.setter
     def frame_current_y(self, value: int) -> None:
         self._frame_current_y = value % self._frame_count_y if self._frame_count_y else 0
-        if self._tg:
-            self._tg[0] = self._frame_current_y * self._frame_count_x + self.frame_current_x if self._frame_count_y else 0
+        self._update_frame()
     
     @property
     def fps(self) -> float:
@@ -315,56 +927,104 @@ class Sprite2DNode(_GroupNode):
     
     @fps.setter
     def fps(self, value: float) -> None:
-        self._fps = min(value, 0)
-        self._frame_duration = 1 / value if value > 0 else None
-        self._frame_time = 0
+        self._fps = max(value, 0)
+        self._schedule()
 
-    def _set_layer(self, value: int) -> None:
-        super()._set_layer(value)
-        if not self._tg and self._texture and self._transparent_color:
-            if not self._frame_count_x:
-                self._frame_count_x = 1
-            if not self._frame_count_y:
-                self._frame_count_y = 1
-            self._make_tg()
+    @property
+    def playing(self) -> bool:
+        return self._playing
+
+    @playing.setter
+    def playing(self, value: bool) -> None:
+        self._playing = value
+        self._schedule()
+
+    def _schedule(self) -> None:
+        # frames can only advance once a texture has set up the tile grid and frame counts
+        clock = _get_animation_clock(self._fps) if self._playing and self._fps > 0 and self._tg is not None else None
+        if clock is self._clock:
+            return
+        if self._clock is not None:
+            self._clock.sprites.remove(self)
+        if clock is not None:
+            clock.sprites.append(self)
+        self._clock = clock
+
+_RECTANGLE_TILE = 16
+
+def _rectangle_bitmap(width: int, height: int) -> displayio.Bitmap:
+    # a single color index, so the bitmap never needs to be drawn
+    key = (Rectangle2DNode, width, height)
+    if (bitmap := _bitmap_cache.get(key)) is None:
+        bitmap = displayio.Bitmap(width, height, 1)
+        _bitmap_cache.put(key, bitmap)
+    return bitmap
 
-    def tick(self, dt: float) -> None:
-        if not self._tg:
-            if not self._frame_count_x:
-                self._frame_count_x = 1
-            if not self._frame_count_y:
-                self._frame_count_y = 1
-            self._make_tg()
-            
-        if self.playing and self._frame_duration:
-            self._frame_time += dt
-            if self._frame_time >= self._frame_duration:
-                self.frame_current_x += 1
-                self._frame_time = 0
-                if not self.loop and self.frame_current_x == self._frame_count_x - 1:
-                    self.playing = False
-        
 class Rectangle2DNode(_GroupNode):
 
     def __init__(self, position: Vector2|tuple = None, width: float = 1, height: float = 1, color: Color = None, opacity: float = 1, outline: bool = False, rotation: float = 0, scale: Vector2|tuple|float|int = 1, layer: int = 0):
-        super().__init__(position, rotation, scale, opacity, layer)
+        self._width, self._height = width, height
         self._outline = outline
-        
-        self._bitmap = displayio.Bitmap(width, height, 1 + int(outline))
-        self._palette = displayio.Palette(1 + int(outline))
-        self.color = _get_color(color)
-        if outline:
-            self._palette.make_transparent(0)
-            for y in range(height):
-                self._bitmap[0, y] = 1
-                self._bitmap[width-1, y] = 1
-                if y in (0, height - 1):
-                    for x in range(1, width-1):
-                        self._bitmap[x, y] = 1
-        
-        self._tg = displayio.TileGrid(bitmap=self._bitmap, pixel_shader=self._palette)
-        self._tg.x, self._tg.y = -width // 2, -height // 2
-        self._group.append(self._tg)
+        self._color = None
+        self._palette = displayio.Palette(1)
+        self._tgs = []
+        self._tiled_width, self._tiled_height = 0, 0
+        super().__init__(position, rotation, scale, opacity, layer)
+        self.color = color
+
+    def _fill(self, x: int, y: int, width: int, height: int) -> None:
+        # tiles of a shared bitmap cover the area, the last row and column overlap rather than needing their own bitmaps
+        tile_width, tile_height = min(width, _RECTANGLE_TILE), min(height, _RECTANGLE_TILE)
+        bitmap = _rectangle_bitmap(tile_width, tile_height)
+        columns, rows = width // tile_width, height // tile_height
+        self._add_tg(bitmap, x, y, columns, rows)
+        if width % tile_width:
+            self._add_tg(bitmap, x + width - tile_width, y, 1, rows)
+        if height % tile_height:
+            self._add_tg(bitmap, x, y + height - tile_height, columns, 1)
+        if width % tile_width and height % tile_height:
+            self._add_tg(bitmap, x + width - tile_width, y + height - tile_height, 1, 1)
+
+    def _add_tg(self, bitmap: displayio.Bitmap, x: int, y: int, columns: int, rows: int) -> None:
+        if (tg := _pool_get((Rectangle2DNode, bitmap, columns, rows))) is not None:
+            tg.pixel_shader = self._palette
+        else:
+            tg = displayio.TileGrid(bitmap=bitmap, pixel_shader=self._palette, width=columns, height=rows)
+        tg.x, tg.y = x, y
+        self._tgs.append(tg)
+        self._group.append(tg)
+
+    def _resize(self, width: int, height: int) -> None:
+        width, height = max(int(width), 1), max(int(height), 1)
+        if self._tgs and self._tiled_width == width and self._tiled_height == height:
+            return
+        self._release()
+        self._tiled_width, self._tiled_height = width, height
+
+        x, y = -width // 2, -height // 2
+        if self._outline and width > 2 and height > 2:
+            self._fill(x, y, width, 1)
+            self._fill(x, y + height - 1, width, 1)
+            self._fill(x, y + 1, 1, height - 2)
+            self._fill(x + width - 1, y + 1, 1, height - 2)
+        else:
+            self._fill(x, y, width, height)
+        self._cull_touch()
+        engine_main._dirty = True
+
+    def _update_scale(self) -> None:
+        super()._update_scale()
+        if self._is_integer_scale():
+            self._resize(self._width, self._height)
+        else:
+            # fractional scales resize the geometry instead
+            self._group.scale = 1
+            self._resize(round(self._width * self._scale.x), round(self._height * self._scale.x))
+
+    def _update_opacity(self) -> None:
+        if self._color:
+            self._palette[0] = _blend(self._color._rgb888, engine_main._bg_palette[0], self._opacity)
+            engine_main._dirty = True
 
     @property
     def color(self) -> Color:
@@ -373,44 +1033,490 @@ class Rectangle2DNode(_GroupNode):
     @color.setter
     def color(self, value: Color|int) -> None:
         self._color = _get_color(value)
-        if self._color:
-            self._palette[int(self._outline)] = self._color._rgb888
+        self._update_opacity()
+
+    def _release(self) -> None:
+        while self._tgs:
+            tg = self._tgs.pop()
+            self._group.remove(tg)
+            _pool_put((Rectangle2DNode, tg.bitmap, tg.width, tg.height), tg)
 
     @property
     def width(self) -> int:
-        return self._bitmap.width
+        return self._width
+
+    @width.setter
+    def width(self, value: int) -> None:
+        self._width = value
+        self._update_scale()
     
     @property
     def height(self) -> int:
-        return self._bitmap.height
+        return self._height
+
+    @height.setter
+    def height(self, value: int) -> None:
+        self._height = value
+        self._update_scale()
+
+    @property
+    def outline(self) -> bool:
+        return self._outline
+
+    @outline.setter
+    def outline(self, value: bool) -> None:
+        self._outline = value
+        self._tiled_width = 0
+        self._update_scale()
+
+def _line_bitmap(dx: int, dy: int, thickness: int) -> displayio.Bitmap:
+    key = (Line2DNode, dx, dy, thickness)
+    if (bitmap := _bitmap_cache.get(key)) is not None:
+        return bitmap
+    bitmap = displayio.Bitmap(abs(dx) + thickness, abs(dy) + thickness, 2)
+    x1, y1 = (0 if dx >= 0 else -dx), (0 if dy >= 0 else -dy)
+    for i in range(thickness):
+        for j in range(thickness):
+            bitmaptools.draw_line(bitmap, x1 + i, y1 + j, x1 + dx + i, y1 + dy + j, 1)
+    _bitmap_cache.put(key, bitmap)
+    return bitmap
+
+def _circle_bitmap(radius: int, outline: bool) -> displayio.Bitmap:
+    key = (Circle2DNode, radius, outline)
+    if (bitmap := _bitmap_cache.get(key)) is not None:
+        return bitmap
+    bitmap = displayio.Bitmap(radius * 2 + 1, radius * 2 + 1, 2)
+    for y in range(-radius, radius + 1):
+        outer = int(math.sqrt((radius + 0.5) ** 2 - y * y))
+        # outlines keep the pixels outside a circle one pixel smaller
+        inner = int(math.sqrt((radius - 0.5) ** 2 - y * y)) if outline and abs(y) < radius else -1
+        if inner < 0:
+            bitmaptools.fill_region(bitmap, radius - outer, radius + y, radius + outer + 1, radius + y + 1, 1)
+        else:
+            bitmaptools.fill_region(bitmap, radius - outer, radius + y, radius - inner, radius + y + 1, 1)
+            bitmaptools.fill_region(bitmap, radius + inner + 1, radius + y, radius + outer + 1, radius + y + 1, 1)
+    _bitmap_cache.put(key, bitmap)
+    return bitmap
+
+class _ShapeNode(_GroupNode):
+
+    def __init__(self, position: Vector2|tuple = None, color: Color|int = None, opacity: float = 1, rotation: float = 0, scale: Vector2|tuple|float|int = 1, layer: int = 0):
+        # the geometry bitmap is shared between identical shapes, only the palette belongs to the node
+        self._color = None
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
+        self._tg = None
+        super().__init__(position, rotation, scale, opacity, layer)
+        self.color = color
+
+    def _set_bitmap(self, bitmap: displayio.Bitmap) -> None:
+        if self._tg is not None:
+            if self._tg.bitmap is bitmap:
+                return
+            self._release()
+        if (tg := _pool_get((bitmap, bitmap.width, bitmap.height))) is not None:
+            tg.pixel_shader = self._palette
+        else:
+            tg = displayio.TileGrid(bitmap=bitmap, pixel_shader=self._palette)
+        tg.x, tg.y = -bitmap.width // 2, -bitmap.height // 2
+        self._tg = tg
+        self._group.append(tg)
+        self._cull_touch()
+        engine_main._dirty = True
+
+    def _release(self) -> None:
+        if self._tg:
+            self._group.remove(self._tg)
+            _pool_put((self._tg.bitmap, self._tg.tile_width, self._tg.tile_height), self._tg)
+            self._tg = None
+
+    def _update_opacity(self) -> None:
+        if self._color:
+            self._palette[1] = _blend(self._color._rgb888, engine_main._bg_palette[0], self._opacity)
+            engine_main._dirty = True
+
+    @property
+    def color(self) -> Color:
+        return self._color
+    
+    @color.setter
+    def color(self, value: Color|int) -> None:
+        self._color = _get_color(value)
+        self._update_opacity()
+
+class Line2DNode(_ShapeNode):
+
+    def __init__(self, start: Vector2|tuple = None, end: Vector2|tuple = None, color: Color|int = None, thickness: int = 1, outline: bool = False, opacity: float = 1, layer: int = 0):
+        self._thickness = max(int(thickness), 1)
+        self._outline = outline
+        self._start = Vector2(0, 0)
+        self._end = Vector2(0, 0)
+        super().__init__(None, color, opacity, 0, 1, layer)
+        # set both ends before listening so the geometry is only built once
+        _set_vector(self._start, start)
+        _set_vector(self._end, end)
+        self._start._on_change = self._update_line
+        self._end._on_change = self._update_line
+        self._update_line()
+
+    def _update_line(self) -> None:
+        # the node's position is the midpoint of the line
+        self._position._set((self._start.x + self._end.x) / 2, (self._start.y + self._end.y) / 2)
+        self._set_bitmap(_line_bitmap(int(self._end.x - self._start.x), int(self._end.y - self._start.y), self._thickness))
+        # align the bitmap with the start rather than the rounded midpoint
+        self._tg.x = int(min(self._start.x, self._end.x)) - self._group.x
+        self._tg.y = int(min(self._start.y, self._end.y)) - self._group.y
+        self._cull_touch()
+
+    def _update_position(self) -> None:
+        super()._update_position()
+        # moving the line moves both of its ends
+        dx = self._position.x - (self._start.x + self._end.x) / 2
+        dy = self._position.y - (self._start.y + self._end.y) / 2
+        if dx or dy:
+            self._start._x += dx
+            self._start._y += dy
+            self._end._x += dx
+            self._end._y += dy
+
+    @property
+    def start(self) -> Vector2:
+        return self._start
+    
+    @start.setter
+    def start(self, value: Vector2|tuple) -> None:
+        _set_vector(self._start, value)
+
+    @property
+    def end(self) -> Vector2:
+        return self._end
+    
+    @end.setter
+    def end(self, value: Vector2|tuple) -> None:
+        _set_vector(self._end, value)
+
+    @property
+    def thickness(self) -> int:
+        return self._thickness
+    
+    @thickness.setter
+    def thickness(self, value: int) -> None:
+        self._thickness = max(int(value), 1)
+        self._update_line()
+
+    @property
+    def outline(self) -> bool:
+        return self._outline
+    
+    @outline.setter
+    def outline(self, value: bool) -> None:
+        self._outline = value  # NOTE: lines are always drawn solid
+
+class Circle2DNode(_ShapeNode):
+
+    def __init__(self, position: Vector2|tuple = None, radius: float = 1, color: Color|int = None, opacity: float = 1, outline: bool = False, rotation: float = 0, scale: Vector2|tuple|float|int = 1, layer: int = 0):
+        self._radius = radius
+        self._outline = outline
+        super().__init__(position, color, opacity, rotation, scale, layer)
+
+    def _update_scale(self) -> None:
+        super()._update_scale()
+        radius = self._radius
+        if not self._is_integer_scale():
+            # fractional scales resize the geometry instead
+            self._group.scale = 1
+            radius *= self._scale.x
+        self._set_bitmap(_circle_bitmap(max(int(radius + 0.5), 0), self._outline))
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+    
+    @radius.setter
+    def radius(self, value: float) -> None:
+        self._radius = value
+        self._update_scale()
+
+    @property
+    def outline(self) -> bool:
+        return self._outline
+    
+    @outline.setter
+    def outline(self, value: bool) -> None:
+        self._outline = value
+        self._update_scale()
+
+class _PhysicsNode(_GroupNode):
+
+    def __init__(self, position: Vector2|tuple, velocity: Vector2|tuple, rotation: float, mass: float, bounciness: float, dynamic: bool, solid: bool, gravity_scale: Vector2|tuple, flags: int, layer: int):
+        # bodies aren't drawn, children placed on them follow the simulation
+        if type(self).collision is not _PhysicsNode.collision:
+            flags |= engine_physics._CALLBACK
+        if dynamic:
+            flags |= engine_physics._DYNAMIC
+        if solid:
+            flags |= engine_physics._SOLID
+        self._body = engine_physics._add_body(self, flags)
+        self._mass = mass
+        self._velocity = Vector2(0, 0)
+        self._gravity_scale = Vector2(0, 0)
+        super().__init__(position, rotation, None, 1, layer)
+        self._cull_remove()  # bodies are indexed by engine_physics instead
+        self._velocity._on_change = self._update_velocity
+        self._gravity_scale._on_change = self._update_gravity_scale
+        self.velocity = velocity
+        self.gravity_scale = gravity_scale if gravity_scale is not None else 1
+        self.bounciness = bounciness
+        self._update_mass()
+
+    def collision(self, contact: engine_physics.Contact) -> None:
+        pass
+
+    def _update_position(self) -> None:
+        super()._update_position()
+        if not engine_physics._syncing and self._body >= 0:
+            engine_physics._move_body(self._body, self._position.x, self._position.y)
+
+    def _update_velocity(self) -> None:
+        if self._body >= 0:
+            engine_physics._set_velocity(self._body, self._velocity.x, self._velocity.y)
+
+    def _update_gravity_scale(self) -> None:
+        if self._body >= 0:
+            engine_physics._gravity_x[self._body] = self._gravity_scale.x
+            engine_physics._gravity_y[self._body] = self._gravity_scale.y
+
+    def _update_mass(self) -> None:
+        # static bodies and massless ones can't be pushed
+        if self._body >= 0:
+            dynamic = engine_physics._flags[self._body] & engine_physics._DYNAMIC
+            engine_physics._inverse_mass[self._body] = 1 / self._mass if dynamic and self._mass > 0 else 0
+
+    def mark_destroy(self) -> None:
+        super().mark_destroy()
+        if self._body >= 0:
+            engine_physics._remove_body(self._body)
+            self._body = -1
+
+    @property
+    def velocity(self) -> Vector2:
+        return self._velocity
+    
+    @velocity.setter
+    def velocity(self, value: Vector2|tuple) -> None:
+        _set_vector(self._velocity, value)
+
+    @property
+    def gravity_scale(self) -> Vector2:
+        return self._gravity_scale
+    
+    @gravity_scale.setter
+    def gravity_scale(self, value: Vector2|tuple|float) -> None:
+        _set_vector(self._gravity_scale, value)
+
+    @property
+    def mass(self) -> float:
+        return self._mass
+    
+    @mass.setter
+    def mass(self, value: float) -> None:
+        self._mass = value
+        self._update_mass()
+
+    @property
+    def bounciness(self) -> float:
+        return engine_physics._bounciness[self._body] if self._body >= 0 else 0
+    
+    @bounciness.setter
+    def bounciness(self, value: float) -> None:
+        if self._body >= 0:
+            engine_physics._bounciness[self._body] = value
+
+    @property
+    def dynamic(self) -> bool:
+        return self._body >= 0 and bool(engine_physics._flags[self._body] & engine_physics._DYNAMIC)
+    
+    @dynamic.setter
+    def dynamic(self, value: bool) -> None:
+        if self._body >= 0:
+            engine_physics._set_flag(self._body, engine_physics._DYNAMIC, value)
+            self._update_mass()
+
+    @property
+    def solid(self) -> bool:
+        return self._body >= 0 and bool(engine_physics._flags[self._body] & engine_physics._SOLID)
+    
+    @solid.setter
+    def solid(self, value: bool) -> None:
+        if self._body >= 0:
+            engine_physics._set_flag(self._body, engine_physics._SOLID, value)
+
+    @property
+    def sleeping(self) -> bool:
+        return self._body >= 0 and bool(engine_physics._flags[self._body] & engine_physics._SLEEPING)
+
+class PhysicsRectangle2DNode(_PhysicsNode):
+
+    def __init__(self, position: Vector2|tuple = None, velocity: Vector2|tuple = None, rotation: float = 0, mass: float = 1, bounciness: float = 1, dynamic: bool = True, solid: bool = True, gravity_scale: Vector2|tuple = None, width: float = 10, height: float = 10, outline: bool = False, layer: int = 0):
+        # collisions are axis aligned, rotation isn't applied to the body
+        self._width, self._height = width, height
+        self.outline = outline
+        super().__init__(position, velocity, rotation, mass, bounciness, dynamic, solid, gravity_scale, 0, layer)
+        engine_physics._resize_body(self._body, width / 2, height / 2)
+
+    @property
+    def width(self) -> float:
+        return self._width
+    
+    @width.setter
+    def width(self, value: float) -> None:
+        self._width = value
+        if self._body >= 0:
+            engine_physics._resize_body(self._body, self._width / 2, self._height / 2)
+
+    @property
+    def height(self) -> float:
+        return self._height
     
-    # TODO: width/height setters?
+    @height.setter
+    def height(self, value: float) -> None:
+        self._height = value
+        if self._body >= 0:
+            engine_physics._resize_body(self._body, self._width / 2, self._height / 2)
 
-# TODO: Line2DNode, Circle2DNode - may require adafruit_display_shapes
+class PhysicsCircle2DNode(_PhysicsNode):
 
-from terminalio import FONT  # NOTE: Remove when FontResource is supported
+    def __init__(self, position: Vector2|tuple = None, velocity: Vector2|tuple = None, rotation: float = 0, mass: float = 1, bounciness: float = 1, dynamic: bool = True, solid: bool = True, gravity_scale: Vector2|tuple = None, radius: float = 5, outline: bool = False, layer: int = 0):
+        self._radius = radius
+        self.outline = outline
+        super().__init__(position, velocity, rotation, mass, bounciness, dynamic, solid, gravity_scale, engine_physics._CIRCLE, layer)
+        engine_physics._resize_body(self._body, radius, radius)
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+    
+    @radius.setter
+    def radius(self, value: float) -> None:
+        self._radius = value
+        if self._body >= 0:
+            engine_physics._resize_body(self._body, value, value)
+
+from terminalio import FONT
+
+_TEXT_WIDTH_STEP = 16  # text bitmaps grow in steps so counters don't reallocate on every digit
 
 class Text2DNode(_GroupNode):
 
     def __init__(self, position: Vector2|tuple = None, font: FontResource = None, text: str = "", rotation: float = 0, scale: Vector2|tuple|float|int = 1, opacity: float = 1, letter_spacing: int = 1, line_spacing: int = 1, color: Color|int = None, layer: int = 0):
+        # font text is drawn into a bitmap owned by the node, without a font it goes through a terminalio label
+        self._label = None
+        self._tg = None
+        self._font = font
+        self._text = text
+        self._letter_spacing = letter_spacing
+        self._line_spacing = line_spacing
+        self._color = _get_color(color)
+        self._palette = displayio.Palette(2)
+        self._palette.make_transparent(0)
         super().__init__(position, rotation, scale, opacity, layer)
+        self._build()
 
-        self._label = None  # for setters
-        self._font = font
-        self.letter_spacing = letter_spacing
-        self.line_spacing = line_spacing
-        self.color = _get_color(color)
-        
-        self._label = Label(
-            FONT,  # BUG: custom font not supported at this time
-            text=text,
-            anchor_point=(0.5, 0.5),
-            anchored_position=(0, 0),
-            line_spacing=(self._font.texture._bitmap.height + self._line_spacing)/(self._font.texture._bitmap.height - 1) if self._font else 1,
-            color=self._color._rgb888 if color else None,
-        )
-        self._group.append(self._label)
+    def _build(self) -> None:
+        if self._font is not None:
+            self._layout(0)
+            return
+        if (label := _pool_get(Text2DNode)) is not None:
+            label.text = self._text
+            label.color = 0xFFFFFF  # same as a fresh label
+        else:
+            label = Label(
+                FONT,
+                text=self._text,
+                anchor_point=(0.5, 0.5),
+                anchored_position=(0, 0),
+            )
+        self._label = label
+        self._group.append(label)
+        self._update_opacity()
+        self._cull_touch()
+        engine_main._dirty = True
+
+    def _release(self) -> None:
+        if self._label is not None:
+            self._text = self._label.text
+            self._group.remove(self._label)
+            _pool_put(Text2DNode, self._label)
+            self._label = None
+        if self._tg is not None:
+            self._group.remove(self._tg)
+            _pool_put((Text2DNode, self._tg.bitmap.width, self._tg.bitmap.height), self._tg)
+            self._tg = None
+
+    def _set_bitmap(self, width: int, height: int) -> displayio.Bitmap:
+        width = (width + _TEXT_WIDTH_STEP - 1) // _TEXT_WIDTH_STEP * _TEXT_WIDTH_STEP
+        self._release()
+        if (tg := _pool_get((Text2DNode, width, height))) is not None:
+            bitmaptools.fill_region(tg.bitmap, 0, 0, width, height, 0)
+            tg.pixel_shader = self._palette
+        else:
+            tg = displayio.TileGrid(bitmap=displayio.Bitmap(width, height, 2), pixel_shader=self._palette)
+        self._tg = tg
+        self._group.append(tg)
+        return tg.bitmap
+
+    def _layout(self, start: int) -> None:
+        # measure the whole text, but only redraw glyphs from the first changed character on
+        font, text, spacing = self._font, self._text, self._letter_spacing
+        line_height = font.height + self._line_spacing
+        width = x = y = 0
+        start_x = start_y = 0
+        for i in range(len(text)):
+            if i == start:
+                start_x, start_y = x, y
+            if text[i] == "\n":
+                width = max(width, x - spacing)
+                x = 0
+                y += line_height
+            elif (glyph := font.get_glyph(ord(text[i]))) is not None:
+                x += glyph.shift_x + spacing
+        if start >= len(text):
+            start_x, start_y = x, y
+        width = max(width, x - spacing, 1)
+        height = y + font.height
+
+        if self._tg is None or width > self._tg.bitmap.width or height != self._tg.bitmap.height:
+            bitmap = self._set_bitmap(width, height)
+            start, start_x, start_y = 0, 0, 0
+        else:
+            # clear the rest of the changed line and every line below it
+            bitmap = self._tg.bitmap
+            bitmaptools.fill_region(bitmap, start_x, start_y, bitmap.width, min(start_y + line_height, bitmap.height), 0)
+            if start_y + line_height < bitmap.height:
+                bitmaptools.fill_region(bitmap, 0, start_y + line_height, bitmap.width, bitmap.height, 0)
+
+        x, y = start_x, start_y
+        for i in range(start, len(text)):
+            if text[i] == "\n":
+                x = 0
+                y += line_height
+            elif (glyph := font.get_glyph(ord(text[i]))) is not None:
+                offset = font._offsets[glyph.tile_index]
+                bitmaptools.blit(bitmap, font._bitmap, x, y, x1=offset, y1=0, x2=offset + glyph.width, y2=glyph.height)
+                x += glyph.shift_x + spacing
 
+        self._tg.x, self._tg.y = -width // 2, -height // 2
+        compositor.invalidate(bitmap)
+        self._cull_touch()
+        engine_main._dirty = True
+
+    def _update_opacity(self) -> None:
+        # uncolored text is white, like a fresh label
+        color = _blend(self._color._rgb888 if self._color else 0xFFFFFF, engine_main._bg_palette[0], self._opacity)
+        self._palette[1] = color
+        if self._label is not None:
+            self._label.color = color
+        engine_main._dirty = True
 
     @property
     def font(self) -> FontResource:
@@ -418,7 +1524,11 @@ class Text2DNode(_GroupNode):
     
     @font.setter
     def font(self, value: FontResource) -> None:
-        self._font = value  # NOTE: not supported
+        if value is self._font:
+            return
+        self._release()
+        self._font = value
+        self._build()
 
     @property
     def color(self) -> Color:
@@ -427,16 +1537,36 @@ class Text2DNode(_GroupNode):
     @color.setter
     def color(self, value: Color|int) -> None:
         self._color = _get_color(value)
-        if self._label and self._color:
-            self._label.color = self._color._rgb888
+        self._update_opacity()
 
     @property
     def text(self) -> str:
-        return self._label.text
+        return self._label.text if self._label else self._text
     
     @text.setter
     def text(self, value: str) -> None:
-        self._label.text = value
+        if self._label:
+            self._label.text = value
+            self._cull_touch()
+            engine_main._dirty = True
+            return
+        if value == self._text:
+            return
+        start, count = 0, min(len(value), len(self._text))
+        while start < count and value[start] == self._text[start]:
+            start += 1
+        self._text = value
+        self._layout(start)
+
+    @property
+    def letter_spacing(self) -> int:
+        return self._letter_spacing
+    
+    @letter_spacing.setter
+    def letter_spacing(self, value: int) -> None:
+        self._letter_spacing = value
+        if self._tg:
+            self._layout(0)
 
     @property
     def line_spacing(self) -> int:
@@ -445,7 +1575,5 @@ class Text2DNode(_GroupNode):
     @line_spacing.setter
     def line_spacing(self, value: int) -> None:
         self._line_spacing = value
-        if self._font:
-            self._font._line_spacing = value
-        if self._label and self._font:
-            self._label.line_spacing = (self._font.texture._bitmap.height + value) / (self._font.texture._bitmap.height - 1)
+        if self._tg:
+            self._layout(0)
@@ -1,3 +1,583 @@
 # SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
 #
 # SPDX-License-Identifier: GPLv3
+from array import array
+
+import engine
+from engine_math import Vector2
+
+# body state lives in parallel arrays indexed by `node._body`, so stepping allocates nothing
+_DYNAMIC = 0x01
+_SOLID = 0x02
+_CIRCLE = 0x04
+_SLEEPING = 0x08
+_MOVED = 0x10  # repositioned since the last step, so it's tested even if static
+_CALLBACK = 0x20
+_REMOVED = 0x40
+
+_nodes = []
+_flags = array("B")
+_x, _y = array("f"), array("f")
+_vx, _vy = array("f"), array("f")
+_half_width, _half_height = array("f"), array("f")  # circles store their radius in both
+_inverse_mass = array("f")
+_bounciness = array("f")
+_gravity_x, _gravity_y = array("f"), array("f")  # per body gravity scale
+_idle = array("f")
+_cell_x, _cell_y = array("h"), array("h")  # first broadphase cell covered by each body
+_seen = array("L")  # last query each body was reported by
+_removed = False
+_sleepers = 0  # bodies asleep, waking costs nothing while there are none
+_waking = array("H")  # stack of woken bodies whose neighbours still need to be woken
+_waking_count = 0
+
+_gravity = Vector2(0, 0)  # in pixels per second squared
+_step = 1 / 60
+_max_steps = 4
+_accumulator = 0
+_syncing = False  # set while bodies write back to their nodes
+
+_SLEEP_SPEED = 2  # pixels per second
+_SLEEP_DELAY = 0.5  # seconds below the sleep speed before a body sleeps
+_BOUNCE_SPEED = 10  # slower impacts don't bounce, so resting contacts settle
+_SLOP = 0.01  # penetration allowed to remain, avoids jitter in resting contacts
+_CORRECTION = 0.8
+_ITERATIONS = 4  # velocity passes over the contacts of each step
+
+# broadphase spatial hash, rebuilt every step into linked lists stored in arrays
+_CELL = 32
+_BUCKETS = 256
+_heads = array("h", [-1] * _BUCKETS)
+_entry_body = array("H")
+_entry_x, _entry_y = array("h"), array("h")
+_entry_next = array("h")
+_entries = 0
+_hashed = False  # the hash matches the current bodies, so queries can reuse it
+
+# contacts collected during a step and dispatched to `collision` once it completes
+_contact_a, _contact_b = array("H"), array("H")
+_contact_nx, _contact_ny = array("f"), array("f")
+_contact_px, _contact_py = array("f"), array("f")
+_contacts = 0
+
+# solid contacts of the current step, their velocities are solved again to settle stacks
+_touch_a, _touch_b = array("H"), array("H")
+_touch_nx, _touch_ny = array("f"), array("f")
+_touches = 0
+
+class Contact:
+    # reused for every callback, copy values out to keep them
+
+    def __init__(self):
+        self.node = None
+        self.position = Vector2(0, 0)
+        self.normal = Vector2(0, 0)
+
+_contact = Contact()
+
+def set_gravity(x: float|Vector2, y: float = None) -> None:
+    if y is None:
+        x, y = x.x, x.y
+    if _sleepers and (x != _gravity.x or y != _gravity.y):
+        # only bodies that gravity pulls on start moving again
+        for i in range(len(_nodes)):
+            if _flags[i] & _SLEEPING and (_gravity_x[i] or _gravity_y[i]):
+                _rouse(i)
+    _gravity._set(x, y)
+
+def get_gravity() -> Vector2:
+    return Vector2(_gravity.x, _gravity.y)
+
+def set_substep(step: float = 1 / 60, max_steps: int = 4) -> None:
+    # physics always advances in steps of `step` seconds, with up to `max_steps` per engine tick
+    global _step, _max_steps, _accumulator
+    _step = step
+    _max_steps = max(max_steps, 1)
+    _accumulator = 0
+
+def _add_body(node: object, flags: int) -> int:
+    global _hashed
+    _hashed = False
+    if not _nodes:
+        engine._add_system(_tick)
+    # the columns only grow, slots past the last body are spare capacity left by removals
+    index = len(_nodes)
+    _nodes.append(node)
+    if index == len(_flags):
+        for values in (_flags, _x, _y, _vx, _vy, _half_width, _half_height, _inverse_mass, _bounciness, _gravity_x, _gravity_y, _idle, _cell_x, _cell_y, _seen):
+            values.append(0)
+    for values in (_x, _y, _vx, _vy, _half_width, _half_height, _inverse_mass, _bounciness, _gravity_x, _gravity_y, _idle, _cell_x, _cell_y, _seen):
+        values[index] = 0
+    _flags[index] = flags
+    return index
+
+def _remove_body(index: int) -> None:
+    # compacted before the next step so indices stay valid while contacts are dispatched
+    global _removed
+    _wake_body(index)
+    _rouse(index)
+    _flags[index] |= _REMOVED
+    _nodes[index] = None
+    _removed = True
+
+def _prune() -> None:
+    global _removed
+    j = 0
+    for i in range(len(_nodes)):
+        if _flags[i] & _REMOVED:
+            continue
+        if i != j:
+            for values in (_flags, _x, _y, _vx, _vy, _half_width, _half_height, _inverse_mass, _bounciness, _gravity_x, _gravity_y, _idle):
+                values[j] = values[i]
+            _nodes[j] = _nodes[i]
+            _nodes[j]._body = j
+        j += 1
+    del _nodes[j:]  # arrays can't shrink on the device, their tails are reused by `_add_body`
+    _removed = False
+    if not _nodes:
+        engine._remove_system(_tick)
+
+def _rouse(index: int) -> None:
+    global _sleepers
+    if _flags[index] & _SLEEPING:
+        _flags[index] &= ~_SLEEPING
+        _sleepers -= 1
+    _idle[index] = 0
+
+def _wake_body(index: int) -> None:
+    # bodies resting against this one may lose their support
+    if _sleepers:
+        _wake(_x[index] - _half_width[index] - 1, _y[index] - _half_height[index] - 1, _x[index] + _half_width[index] + 1, _y[index] + _half_height[index] + 1)
+
+def _wake(x0: float, y0: float, x1: float, y1: float) -> None:
+    # bodies resting on a woken one are woken in turn, until nothing is left asleep to wake
+    global _waking_count
+    _wake_region(x0, y0, x1, y1)
+    while _waking_count and _sleepers:
+        _waking_count -= 1
+        i = _waking[_waking_count]
+        _wake_region(_x[i] - _half_width[i] - 1, _y[i] - _half_height[i] - 1, _x[i] + _half_width[i] + 1, _y[i] + _half_height[i] + 1)
+    _waking_count = 0
+
+def _wake_region(x0: float, y0: float, x1: float, y1: float) -> None:
+    # sleeping bodies are found through the hash of the last step, they haven't moved since apart from the
+    # contacts resolved after hashing, so a cell of slack is searched around the area
+    global _waking_count
+    for x in range(_cell(x0) - 1, _cell(x1) + 2):
+        for y in range(_cell(y0) - 1, _cell(y1) + 2):
+            entry = _heads[(x * 92821 + y * 68917) & (_BUCKETS - 1)]
+            while entry >= 0:
+                i = _entry_body[entry]
+                if _entry_x[entry] == x and _entry_y[entry] == y and _flags[i] & _SLEEPING and _x[i] + _half_width[i] >= x0 and _x[i] - _half_width[i] <= x1 and _y[i] + _half_height[i] >= y0 and _y[i] - _half_height[i] <= y1:
+                    _rouse(i)
+                    if _waking_count == len(_waking):
+                        _waking.append(0)
+                    _waking[_waking_count] = i
+                    _waking_count += 1
+                entry = _entry_next[entry]
+
+def _move_body(index: int, x: float, y: float) -> None:
+    global _hashed
+    _hashed = False
+    _wake_body(index)
+    _rouse(index)
+    _x[index], _y[index] = x, y
+    _flags[index] |= _MOVED
+
+def _resize_body(index: int, half_width: float, half_height: float) -> None:
+    # wakes bodies around both the old and the new bounds
+    global _hashed
+    _hashed = False
+    if _sleepers:
+        width, height = max(_half_width[index], half_width) + 1, max(_half_height[index], half_height) + 1
+        _wake(_x[index] - width, _y[index] - height, _x[index] + width, _y[index] + height)
+    _rouse(index)
+    _half_width[index], _half_height[index] = half_width, half_height
+    _flags[index] |= _MOVED
+
+def _set_velocity(index: int, x: float, y: float) -> None:
+    _vx[index], _vy[index] = x, y
+    _rouse(index)
+
+def _set_flag(index: int, flag: int, value: bool) -> None:
+    flags = _flags[index] | _MOVED
+    _flags[index] = flags | flag if value else flags & ~flag
+    _rouse(index)
+
+def _tick(dt: float) -> None:
+    global _accumulator
+    _accumulator += dt
+    steps = int(_accumulator / _step)
+    _accumulator -= steps * _step
+    if steps > _max_steps:
+        steps = _max_steps  # drop the backlog instead of spiralling
+    for i in range(steps):
+        _step_bodies(_step)
+        _sync()
+        _dispatch()
+
+def _step_bodies(dt: float) -> None:
+    global _contacts, _touches, _hashed, _sleepers
+    if _removed:
+        _prune()
+    gx, gy = _gravity.x * dt, _gravity.y * dt
+    for i in range(len(_nodes)):
+        if _flags[i] & (_DYNAMIC | _SLEEPING) == _DYNAMIC:
+            _vx[i] += gx * _gravity_x[i]
+            _vy[i] += gy * _gravity_y[i]
+            _x[i] += _vx[i] * dt
+            _y[i] += _vy[i] * dt
+
+    _broadphase()
+    _contacts = _touches = 0
+    for bucket in range(_BUCKETS):
+        a = _heads[bucket]
+        while a >= 0:
+            x, y = _entry_x[a], _entry_y[a]
+            b = _entry_next[a]
+            while b >= 0:
+                if _entry_x[b] == x and _entry_y[b] == y:
+                    _collide(_entry_body[a], _entry_body[b], x, y)
+                b = _entry_next[b]
+            a = _entry_next[a]
+
+    # a single pass leaves bodies in a stack pushing on each other, so they would never come to rest
+    for j in range(_ITERATIONS - 1):
+        for i in range(_touches):
+            _solve(_touch_a[i], _touch_b[i], _touch_nx[i], _touch_ny[i], False)
+
+    _hashed = False  # contacts moved bodies after hashing
+    for i in range(len(_nodes)):
+        flags = _flags[i]
+        _flags[i] = flags & ~_MOVED
+        if flags & (_DYNAMIC | _SLEEPING) != _DYNAMIC:
+            continue
+        if _vx[i] * _vx[i] + _vy[i] * _vy[i] < _SLEEP_SPEED * _SLEEP_SPEED:
+            _idle[i] += dt
+            if _idle[i] >= _SLEEP_DELAY:
+                _flags[i] |= _SLEEPING
+                _sleepers += 1
+                _vx[i] = _vy[i] = 0
+                velocity = _nodes[i]._velocity
+                velocity._x = velocity._y = 0
+        else:
+            _idle[i] = 0
+
+def _cell(value: float) -> int:
+    return min(max(int(value // _CELL), -16384), 16383)
+
+def _broadphase() -> None:
+    global _entries
+    for bucket in range(_BUCKETS):
+        _heads[bucket] = -1
+    _entries = 0
+    for i in range(len(_nodes)):
+        x0, y0 = _cell(_x[i] - _half_width[i]), _cell(_y[i] - _half_height[i])
+        x1, y1 = _cell(_x[i] + _half_width[i]), _cell(_y[i] + _half_height[i])
+        _cell_x[i], _cell_y[i] = x0, y0
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                bucket = (x * 92821 + y * 68917) & (_BUCKETS - 1)
+                if _entries == len(_entry_body):
+                    _entry_body.append(0)
+                    _entry_x.append(0)
+                    _entry_y.append(0)
+                    _entry_next.append(0)
+                _entry_body[_entries] = i
+                _entry_x[_entries], _entry_y[_entries] = x, y
+                _entry_next[_entries] = _heads[bucket]
+                _heads[bucket] = _entries
+                _entries += 1
+
+def _collide(a: int, b: int, cell_x: int, cell_y: int) -> None:
+    # pairs of bodies that can't move are skipped, as are pairs already tested in an earlier shared cell
+    flags_a, flags_b = _flags[a], _flags[b]
+    if not (flags_a & (_DYNAMIC | _SLEEPING) == _DYNAMIC or flags_a & _MOVED or flags_b & (_DYNAMIC | _SLEEPING) == _DYNAMIC or flags_b & _MOVED):
+        return
+    dx, dy = _x[a] - _x[b], _y[a] - _y[b]
+    overlap_x = _half_width[a] + _half_width[b] - abs(dx)
+    overlap_y = _half_height[a] + _half_height[b] - abs(dy)
+    if overlap_x <= 0 or overlap_y <= 0:
+        return
+    if max(_cell_x[a], _cell_x[b]) != cell_x or max(_cell_y[a], _cell_y[b]) != cell_y:
+        return
+
+    # the normal points from b towards a
+    if flags_a & _CIRCLE and flags_b & _CIRCLE:
+        radius = _half_width[a] + _half_width[b]
+        distance = (dx * dx + dy * dy) ** 0.5
+        if distance >= radius:
+            return
+        if distance:
+            nx, ny = dx / distance, dy / distance
+        else:
+            nx, ny = 0, -1
+        depth = radius - distance
+        px, py = _x[b] + nx * _half_width[b], _y[b] + ny * _half_width[b]
+    elif flags_a & _CIRCLE or flags_b & _CIRCLE:
+        circle, box, sign = (a, b, 1) if flags_a & _CIRCLE else (b, a, -1)
+        px = min(max(_x[circle], _x[box] - _half_width[box]), _x[box] + _half_width[box])
+        py = min(max(_y[circle], _y[box] - _half_height[box]), _y[box] + _half_height[box])
+        nx, ny = _x[circle] - px, _y[circle] - py
+        distance = (nx * nx + ny * ny) ** 0.5
+        if distance >= _half_width[circle]:
+            return
+        if distance:
+            nx, ny = nx / distance * sign, ny / distance * sign
+            depth = _half_width[circle] - distance
+        elif overlap_x < overlap_y:
+            # the center is inside the box, so push out along the shallowest axis
+            nx, ny, depth = (1 if dx >= 0 else -1), 0, overlap_x
+        else:
+            nx, ny, depth = 0, (1 if dy >= 0 else -1), overlap_y
+    else:
+        if overlap_x < overlap_y:
+            nx, ny, depth = (1 if dx >= 0 else -1), 0, overlap_x
+        else:
+            nx, ny, depth = 0, (1 if dy >= 0 else -1), overlap_y
+        px = (max(_x[a] - _half_width[a], _x[b] - _half_width[b]) + min(_x[a] + _half_width[a], _x[b] + _half_width[b])) / 2
+        py = (max(_y[a] - _half_height[a], _y[b] - _half_height[b]) + min(_y[a] + _half_height[a], _y[b] + _half_height[b])) / 2
+
+    if flags_a & flags_b & _SOLID:
+        _resolve(a, b, nx, ny, depth)
+    if (flags_a | flags_b) & _CALLBACK:
+        _add_contact(a, b, nx, ny, px, py)
+
+def _resolve(a: int, b: int, nx: float, ny: float, depth: float) -> None:
+    global _touches
+    _solve(a, b, nx, ny, True)
+    inverse_a = 0 if _flags[a] & _SLEEPING else _inverse_mass[a]
+    inverse_b = 0 if _flags[b] & _SLEEPING else _inverse_mass[b]
+    total = inverse_a + inverse_b
+    if not total:
+        return
+    correction = max(depth - _SLOP, 0) * _CORRECTION / total
+    _x[a] += nx * correction * inverse_a
+    _y[a] += ny * correction * inverse_a
+    _x[b] -= nx * correction * inverse_b
+    _y[b] -= ny * correction * inverse_b
+
+    # kept for the velocity passes that follow once every contact has been found
+    if _touches == len(_touch_a):
+        for values in (_touch_a, _touch_b, _touch_nx, _touch_ny):
+            values.append(0)
+    _touch_a[_touches], _touch_b[_touches] = a, b
+    _touch_nx[_touches], _touch_ny[_touches] = nx, ny
+    _touches += 1
+
+def _solve(a: int, b: int, nx: float, ny: float, bounce: bool) -> None:
+    # sleeping bodies only wake for real impacts, otherwise they hold still like static ones
+    speed = (_vx[a] - _vx[b]) * nx + (_vy[a] - _vy[b]) * ny
+    if speed >= 0:
+        return  # already separating
+    inverse_a, inverse_b = _inverse_mass[a], _inverse_mass[b]
+    if _flags[a] & _SLEEPING:
+        if speed < -_BOUNCE_SPEED:
+            _rouse(a)
+        else:
+            inverse_a = 0
+    if _flags[b] & _SLEEPING:
+        if speed < -_BOUNCE_SPEED:
+            _rouse(b)
+        else:
+            inverse_b = 0
+    total = inverse_a + inverse_b
+    if not total:
+        return
+    bounciness = min(_bounciness[a], _bounciness[b]) if bounce and speed < -_BOUNCE_SPEED else 0
+    impulse = -(1 + bounciness) * speed / total
+    _vx[a] += impulse * inverse_a * nx
+    _vy[a] += impulse * inverse_a * ny
+    _vx[b] -= impulse * inverse_b * nx
+    _vy[b] -= impulse * inverse_b * ny
+
+def _add_contact(a: int, b: int, nx: float, ny: float, px: float, py: float) -> None:
+    global _contacts
+    if _contacts == len(_contact_a):
+        for values in (_contact_a, _contact_b, _contact_nx, _contact_ny, _contact_px, _contact_py):
+            values.append(0)
+    _contact_a[_contacts], _contact_b[_contacts] = a, b
+    _contact_nx[_contacts], _contact_ny[_contacts] = nx, ny
+    _contact_px[_contacts], _contact_py[_contacts] = px, py
+    _contacts += 1
+
+def _sync() -> None:
+    global _syncing
+    _syncing = True
+    for i in range(len(_nodes)):
+        if _flags[i] & (_DYNAMIC | _SLEEPING | _REMOVED) == _DYNAMIC:
+            node = _nodes[i]
+            node._velocity._x, node._velocity._y = _vx[i], _vy[i]
+            node._position._set(_x[i], _y[i])
+    _syncing = False
+
+def _dispatch() -> None:
+    # each node is told about the other, with the normal pointing away from it
+    contact = _contact
+    for i in range(_contacts):
+        a, b = _contact_a[i], _contact_b[i]
+        contact.position._x, contact.position._y = _contact_px[i], _contact_py[i]
+        if _flags[a] & _CALLBACK and not _flags[a] & _REMOVED and not _flags[b] & _REMOVED:
+            contact.node = _nodes[b]
+            contact.normal._x, contact.normal._y = _contact_nx[i], _contact_ny[i]
+            _nodes[a].collision(contact)
+        if _flags[b] & _CALLBACK and not _flags[a] & _REMOVED and not _flags[b] & _REMOVED:
+            contact.node = _nodes[a]
+            contact.normal._x, contact.normal._y = -_contact_nx[i], -_contact_ny[i]
+            _nodes[b].collision(contact)
+    contact.node = None
+
+# queries are answered from the broadphase hash for bodies and from the grid engine_nodes keeps of drawn groups,
+# results are written to reused lists which are only valid until the next query
+_results = []
+_candidates = []
+_pairs = []
+_distances = array("f")
+_query_frame = 0
+
+def _contains(index: int, x0: float, y0: float, x1: float, y1: float) -> bool:
+    if _flags[index] & _REMOVED:
+        return False
+    if _flags[index] & _CIRCLE:
+        dx = _x[index] - min(max(_x[index], x0), x1)
+        dy = _y[index] - min(max(_y[index], y0), y1)
+        return dx * dx + dy * dy <= _half_width[index] * _half_width[index]
+    return _x[index] - _half_width[index] <= x1 and _x[index] + _half_width[index] >= x0 and _y[index] - _half_height[index] <= y1 and _y[index] + _half_height[index] >= y0
+
+def _query_bodies(x0: float, y0: float, x1: float, y1: float) -> None:
+    global _hashed, _query_frame
+    if not _hashed:
+        _broadphase()
+        _hashed = True
+    _query_frame += 1
+    frame = _query_frame
+    for x in range(_cell(x0), _cell(x1) + 1):
+        for y in range(_cell(y0), _cell(y1) + 1):
+            entry = _heads[(x * 92821 + y * 68917) & (_BUCKETS - 1)]
+            while entry >= 0:
+                if _entry_x[entry] == x and _entry_y[entry] == y:
+                    i = _entry_body[entry]
+                    if _seen[i] != frame and _contains(i, x0, y0, x1, y1):
+                        _seen[i] = frame
+                        _results.append(_nodes[i])
+                entry = _entry_next[entry]
+
+def _query_groups(x0: float, y0: float, x1: float, y1: float, results: list) -> None:
+    import engine_nodes
+    engine_nodes._query(x0, y0, x1, y1, results)
+
+def query_point(x: float, y: float) -> list:
+    _results.clear()
+    _query_bodies(x, y, x, y)
+    _query_groups(x, y, x, y, _results)
+    return _results
+
+def query_aabb(x0: float, y0: float, x1: float, y1: float) -> list:
+    _results.clear()
+    _query_bodies(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+    _query_groups(min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1), _results)
+    return _results
+
+def _ray_box(x: float, y: float, dx: float, dy: float, length: float, x0: float, y0: float, x1: float, y1: float) -> float:
+    # slab test, returns the entry distance or -1 when the ray misses
+    near, far = 0, length
+    if dx:
+        t0, t1 = (x0 - x) / dx, (x1 - x) / dx
+        near, far = max(near, min(t0, t1)), min(far, max(t0, t1))
+    elif x < x0 or x > x1:
+        return -1
+    if dy:
+        t0, t1 = (y0 - y) / dy, (y1 - y) / dy
+        near, far = max(near, min(t0, t1)), min(far, max(t0, t1))
+    elif y < y0 or y > y1:
+        return -1
+    return near if near <= far else -1
+
+def _ray_circle(x: float, y: float, dx: float, dy: float, length: float, index: int) -> float:
+    cx, cy, radius = _x[index] - x, _y[index] - y, _half_width[index]
+    along = cx * dx + cy * dy
+    across = cx * cx + cy * cy - along * along
+    if across > radius * radius:
+        return -1
+    half_chord = (radius * radius - across) ** 0.5
+    if along + half_chord < 0:
+        return -1  # the circle is entirely behind the origin
+    distance = max(along - half_chord, 0)
+    return distance if distance <= length else -1
+
+def query_ray(x: float, y: float, dx: float, dy: float, length: float) -> list:
+    # nodes hit within `length` of the origin along the direction, nearest first
+    magnitude = (dx * dx + dy * dy) ** 0.5
+    if not magnitude:
+        return query_point(x, y)
+    dx, dy = dx / magnitude, dy / magnitude
+    query_aabb(x, y, x + dx * length, y + dy * length)
+
+    count = 0
+    for node in _results:
+        if getattr(node, "_body", -1) >= 0:
+            i = node._body
+            if _flags[i] & _CIRCLE:
+                distance = _ray_circle(x, y, dx, dy, length, i)
+            else:
+                distance = _ray_box(x, y, dx, dy, length, _x[i] - _half_width[i], _y[i] - _half_height[i], _x[i] + _half_width[i], _y[i] + _half_height[i])
+        else:
+            distance = _ray_box(x, y, dx, dy, length, node._cull_x0, node._cull_y0, node._cull_x1, node._cull_y1)
+        if distance < 0:
+            continue
+        # insertion sort into the front of the buffer, which only holds hits once done
+        if count == len(_distances):
+            _distances.append(0)
+        j = count
+        while j and _distances[j - 1] > distance:
+            _distances[j] = _distances[j - 1]
+            _results[j] = _results[j - 1]
+            j -= 1
+        _distances[j] = distance
+        _results[j] = node
+        count += 1
+    del _results[count:]
+    return _results
+
+def _overlap(a: int, b: int) -> bool:
+    if _flags[a] & _CIRCLE and _flags[b] & _CIRCLE:
+        dx, dy, radius = _x[a] - _x[b], _y[a] - _y[b], _half_width[a] + _half_width[b]
+        return dx * dx + dy * dy < radius * radius
+    if _flags[b] & _CIRCLE:
+        a, b = b, a
+    return _contains(a, _x[b] - _half_width[b], _y[b] - _half_height[b], _x[b] + _half_width[b], _y[b] + _half_height[b])
+
+def overlapping_pairs() -> list:
+    # a flat list of the nodes overlapping each other, as [a0, b0, a1, b1, ...]
+    global _hashed
+    _pairs.clear()
+    if not _hashed:
+        _broadphase()
+        _hashed = True
+    for bucket in range(_BUCKETS):
+        a = _heads[bucket]
+        while a >= 0:
+            x, y = _entry_x[a], _entry_y[a]
+            b = _entry_next[a]
+            while b >= 0:
+                i, j = _entry_body[a], _entry_body[b]
+                if _entry_x[b] == x and _entry_y[b] == y and not (_flags[i] | _flags[j]) & _REMOVED and max(_cell_x[i], _cell_x[j]) == x and max(_cell_y[i], _cell_y[j]) == y and _overlap(i, j):
+                    _pairs.append(_nodes[i])
+                    _pairs.append(_nodes[j])
+                b = _entry_next[b]
+            a = _entry_next[a]
+
+    # bodies against drawn groups, then groups against each other
+    for i in range(len(_nodes)):
+        if _flags[i] & _REMOVED:
+            continue
+        _candidates.clear()
+        _query_groups(_x[i] - _half_width[i], _y[i] - _half_height[i], _x[i] + _half_width[i], _y[i] + _half_height[i], _candidates)
+        for node in _candidates:
+            if _contains(i, node._cull_x0, node._cull_y0, node._cull_x1, node._cull_y1):
+                _pairs.append(_nodes[i])
+                _pairs.append(node)
+    _candidates.clear()
+    import engine_nodes
+    engine_nodes._query_pairs(_pairs)
+    return _pairs
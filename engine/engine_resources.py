@@ -2,23 +2,97 @@
 #
 # SPDX-License-Identifier: GPLv3
 import audiocore
-from displayio import Bitmap
+import bitmaptools
+from displayio import Bitmap, ColorConverter, Colorspace, Palette
 from fontio import Glyph
+import math
 import os
 
 import adafruit_imageload
 
+import compositor
+
 def _get_filepath(filepath: str) -> str:
     # redirect absolute path to filesystem directory
     if filepath.startswith("/"):
         filepath = "/" + "/".join(os.getcwd().strip("/").split("/")[:-2]) + filepath
     return filepath
 
+_PALETTE_LIMIT = 16  # opacity variants kept per texture
+# colors reserved as transparent for the empty corners of rotated frames when a texture has no transparent color
+_CANVAS_KEY565 = 0x0020
+_CANVAS_KEY888 = 0x000400
+
+def _blend(color: int, background: int, opacity: float) -> int:
+    # displayio has no alpha, so colors are faded toward the background instead
+    r = int(((color >> 16) & 0xFF) * opacity + ((background >> 16) & 0xFF) * (1 - opacity))
+    g = int(((color >> 8) & 0xFF) * opacity + ((background >> 8) & 0xFF) * (1 - opacity))
+    b = int((color & 0xFF) * opacity + (background & 0xFF) * (1 - opacity))
+    return (r << 16) | (g << 8) | b
+
+def _blend565(color: int, background: int, opacity: float) -> int:
+    r = int(((color >> 11) & 0x1F) * opacity + ((background >> 11) & 0x1F) * (1 - opacity))
+    g = int(((color >> 5) & 0x3F) * opacity + ((background >> 5) & 0x3F) * (1 - opacity))
+    b = int((color & 0x1F) * opacity + (background & 0x1F) * (1 - opacity))
+    return (r << 11) | (g << 5) | b
+
+def _bitmap_size(bitmap: Bitmap) -> int:
+    # rows are padded to 32 bits
+    return (bitmap.width * bitmap.bits_per_value + 31) // 32 * 4 * bitmap.height
+
+class _BitmapCache:
+
+    def __init__(self, limit: int):
+        self.limit = limit  # in bytes, least recently used bitmaps are evicted beyond it
+        self._bitmaps = {}
+        self._used = {}
+        self._size = 0
+        self._clock = 0
+
+    def get(self, key: tuple) -> Bitmap:
+        bitmap = self._bitmaps.get(key)
+        if bitmap is not None:
+            self._clock += 1
+            self._used[key] = self._clock
+        return bitmap
+
+    def put(self, key: tuple, bitmap: Bitmap) -> None:
+        size = _bitmap_size(bitmap)
+        while self._bitmaps and self._size + size > self.limit:
+            self._evict()
+        self._bitmaps[key] = bitmap
+        self._size += size
+        self._clock += 1
+        self._used[key] = self._clock
+
+    def _evict(self) -> None:
+        oldest = None
+        for key in self._used:
+            if oldest is None or self._used[key] < self._used[oldest]:
+                oldest = key
+        self._size -= _bitmap_size(self._bitmaps.pop(oldest))
+        del self._used[oldest]
+
+    def clear(self) -> None:
+        self._bitmaps.clear()
+        self._used.clear()
+        self._size = 0
+
+# generated frame variants shared by every texture
+_bitmap_cache = _BitmapCache(32768)
+
+def set_bitmap_cache_limit(limit: int) -> None:
+    _bitmap_cache.limit = max(limit, 0)
+    while _bitmap_cache._bitmaps and _bitmap_cache._size > _bitmap_cache.limit:
+        _bitmap_cache._evict()
+
 class TextureResource:
 
     def __init__(self, width: str|int, height: bool|int = False, color: int = None, bit_depth: int = None):  # NOTE: We're not respecting the options here at the moment
         if isinstance(width, str):
             self._bitmap, self._palette = adafruit_imageload.load(_get_filepath(width))
+            self._shaders = {}
+            self._palettes = {}
             self.data = None
         else:
             self.data = bytearray(width * height * 2)  # 16-bit RGB565
@@ -30,6 +104,86 @@ class TextureResource:
     @property
     def height(self) -> int:
         return self._bitmap.height
+
+    def _get_shader(self, color: Color) -> tuple:
+        # the texture's own shader is never modified, each transparent color gets its own variant
+        key = color._rgb565 if color is not None else None
+        if (shader := self._shaders.get(key)) is not None:
+            return shader
+
+        if isinstance(self._palette, Palette):
+            # one extra index past the texture's colors is always transparent
+            count = len(self._palette)
+            palette = Palette(count + 1)
+            transparent = None
+            for i in range(count):
+                palette[i] = self._palette[i]
+                if self._palette.is_transparent(i) or (color is not None and self._palette[i] == color._rgb888):
+                    palette.make_transparent(i)
+                    if transparent is None:
+                        transparent = i
+            palette.make_transparent(count)
+            shader = (palette, count if transparent is None else transparent)
+        else:
+            if self._bitmap.bits_per_value > 16:
+                converter = ColorConverter(input_colorspace=Colorspace.RGB888)
+                value = color._rgb888 if color is not None else _CANVAS_KEY888
+            else:
+                converter = ColorConverter(input_colorspace=Colorspace.RGB565)
+                value = color._rgb565 if color is not None else _CANVAS_KEY565
+            converter.make_transparent(value)
+            compositor._set_transparent(converter, value)
+            shader = (converter, value)
+        self._shaders[key] = shader
+        return shader
+
+    def _get_palette(self, shader: Palette|ColorConverter, opacity: float, background: int) -> Palette|ColorConverter:
+        if opacity >= 1 or not isinstance(shader, Palette):
+            return shader
+        key = (shader, opacity, background)
+        if (palette := self._palettes.get(key)) is not None:
+            return palette
+
+        palette = Palette(len(shader))
+        for i in range(len(shader)):
+            palette[i] = _blend(shader[i], background, opacity)
+            if shader.is_transparent(i):
+                palette.make_transparent(i)
+        if len(self._palettes) >= _PALETTE_LIMIT:
+            self._palettes.clear()
+        self._palettes[key] = palette
+        return palette
+
+    def _get_frame(self, x: int, y: int, width: int, height: int, angle: float, scale: float, opacity: float, background: int, transparent: int) -> Bitmap:
+        key = (self, x, y, width, height, angle, scale, opacity, background if opacity < 1 else None, transparent)
+        if (bitmap := _bitmap_cache.get(key)) is not None:
+            return bitmap
+
+        if angle:
+            # square so that every angle fits without clipping
+            bitmap_width = bitmap_height = math.ceil(math.sqrt(width * width + height * height) * scale)
+        else:
+            bitmap_width, bitmap_height = math.ceil(width * scale), math.ceil(height * scale)
+        bitmap = Bitmap(bitmap_width, bitmap_height, min(max(1 << self._bitmap.bits_per_value, transparent + 1), 65535))
+        bitmap.fill(transparent)
+        bitmaptools.rotozoom(
+            bitmap, self._bitmap,
+            ox=bitmap_width // 2, oy=bitmap_height // 2,
+            px=x + width // 2, py=y + height // 2,
+            source_clip0=(x, y), source_clip1=(x + width, y + height),
+            angle=angle, scale=scale, skip_index=transparent,
+        )
+
+        # indexed textures fade through their palette instead
+        if opacity < 1:
+            background = ((background >> 8) & 0xF800) | ((background >> 5) & 0x07E0) | ((background >> 3) & 0x001F)
+            for i in range(bitmap_width * bitmap_height):
+                if (value := bitmap[i]) != transparent:
+                    value = _blend565(value, background, opacity)
+                    bitmap[i] = value ^ 0x0001 if value == transparent else value
+
+        _bitmap_cache.put(key, bitmap)
+        return bitmap
     
 class WaveSoundResource:
 
@@ -46,14 +200,15 @@ class FontResource:
 
     def __init__(self, filepath: str):
         self.texture = TextureResource(filepath)
+        texture = self.texture._bitmap
         
         self._widths = []
         self._offsets = []
-        y = self.texture.height - 1
-        color = self.texture._bitmap[0, y]
+        y = texture.height - 1
+        color = texture[0, y]
         width = 0
-        for x in range(self.texture.width):
-            value = self.texture._bitmap[x, y]
+        for x in range(texture.width):
+            value = texture[x, y]
             if value != color:
                 color = value
                 self._widths.append(width)
@@ -62,12 +217,16 @@ class FontResource:
             else:
                 width += 1
         self._widths.append(width)
-        self._offsets.append(self.texture.width - width)
+        self._offsets.append(texture.width - width)
         self._widths = tuple(self._widths)
         self._offsets = tuple(self._offsets)
 
-        self._letter_spacing = 1
-        self._line_spacing = 1
+        # glyphs are drawn from a 1-bit atlas, the space glyph comes first so its corner is the background
+        self._bitmap = Bitmap(texture.width, texture.height - 1, 2)
+        background = texture[0, 0]
+        for i in range(self._bitmap.width * self._bitmap.height):
+            if texture[i] != background:
+                self._bitmap[i] = 1
         self._glyphs = [None] * (self._MAX - self._MIN + 1)
 
     @property
@@ -80,32 +239,30 @@ class FontResource:
 
     @property
     def height(self) -> int:
-        return self.texture.height - 1
+        return self._bitmap.height
 
     # `fontio.FontProtocol`
 
     @property
     def bitmap(self) -> Bitmap:
-        return self.texture
+        return self._bitmap
     
     def get_bounding_box(self) -> tuple:
-        return max(self.widths), self.height
+        return max(self._widths), self.height
     
     def get_glyph(self, codepoint: int) -> Glyph:
         if self._MIN <= codepoint <= self._MAX:
             index = codepoint - self._MIN
-            if index in self._glyphs:
-                return self._glyphs[index]
-            else:
-                glyph = Glyph(
-                    self.texture._bitmap,
+            if (glyph := self._glyphs[index]) is None:
+                glyph = self._glyphs[index] = Glyph(
+                    self._bitmap,
                     index,
                     self._widths[index],
-                    self.texture._bitmap.height,
-                    self._offsets[index],
+                    self._bitmap.height,
+                    0,
                     0,
-                    self._widths[index] + self._letter_spacing,
-                    self.height + self._line_spacing
+                    self._widths[index],
+                    self._bitmap.height,
                 )
-                self._glyphs[index] = glyph
-                return glyph
+            return glyph
+        return None
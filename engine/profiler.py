@@ -0,0 +1,114 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+from array import array
+import time
+
+_SIZE = 64  # frames kept per ring
+
+REFRESH = 0
+INPUT = 1
+NODES = 2
+_PHASE_COUNT = 3
+
+_enabled = False
+_dump_interval = 0
+_frames = 0
+
+# one ring buffer (in microseconds) per phase and per ticked node class
+_names = ["refresh", "input", "nodes"]
+_rings = [array("L", [0] * _SIZE) for _ in range(_PHASE_COUNT)]
+_heads = array("H", [0] * _PHASE_COUNT)
+_counts = array("H", [0] * _PHASE_COUNT)
+
+_classes = {}
+_accum = array("L")
+_ticked = bytearray()
+
+def enable(dump_interval: int = 0) -> None:
+    global _enabled, _dump_interval
+    _enabled = True
+    _dump_interval = max(dump_interval, 0)
+
+def disable() -> None:
+    global _enabled
+    _enabled = False
+
+def reset() -> None:
+    global _frames
+    _frames = 0
+    for i in range(len(_rings)):
+        _heads[i] = 0
+        _counts[i] = 0
+
+def names() -> tuple:
+    return tuple(_names)
+
+def stats(name: str) -> tuple:
+    # returns (min, mean, p95, max) in milliseconds
+    if name not in _names:
+        return None
+    index = _names.index(name)
+    count = _counts[index]
+    if not count:
+        return None
+    values = sorted(_rings[index][:count])
+    return (
+        values[0] / 1000,
+        sum(values) / count / 1000,
+        values[(count - 1) * 95 // 100] / 1000,
+        values[-1] / 1000,
+    )
+
+def dump() -> None:
+    print(f"profile: {_frames} frames")
+    for name in _names:
+        if (result := stats(name)) is not None:
+            print("{:>24} min {:.2f} mean {:.2f} p95 {:.2f} max {:.2f} ms".format(name, *result))
+
+def _push(index: int, value: int) -> None:
+    head = _heads[index]
+    _rings[index][head] = value
+    _heads[index] = (head + 1) % _SIZE
+    if _counts[index] < _SIZE:
+        _counts[index] += 1
+
+def _record(index: int, start: int) -> int:
+    now = time.monotonic_ns()
+    _push(index, (now - start) // 1000)
+    return now
+
+def _add_class(cls: type) -> int:
+    index = len(_names)
+    _names.append("node:" + cls.__name__)
+    _rings.append(array("L", [0] * _SIZE))
+    _heads.append(0)
+    _counts.append(0)
+    _classes[cls] = index
+    _accum.append(0)
+    _ticked.append(0)
+    return index
+
+def _tick_nodes(nodes: list, dt: float) -> None:
+    for node in nodes:
+        if node._ticking != 1:
+            continue
+        start = time.monotonic_ns()
+        node.tick(dt)
+        elapsed = time.monotonic_ns() - start
+        if (index := _classes.get(type(node))) is None:
+            index = _add_class(type(node))
+        index -= _PHASE_COUNT
+        _accum[index] += elapsed // 1000
+        _ticked[index] = 1
+
+def _end_frame() -> None:
+    global _frames
+    for i in range(len(_accum)):
+        if _ticked[i]:
+            _push(i + _PHASE_COUNT, _accum[i])
+            _accum[i] = 0
+            _ticked[i] = 0
+    _frames += 1
+    if _dump_interval and not _frames % _dump_interval:
+        dump()
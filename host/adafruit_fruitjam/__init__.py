@@ -0,0 +1,4 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+from adafruit_fruitjam import peripherals
@@ -0,0 +1,44 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import displayio
+import supervisor
+
+# the host display defaults to the size of the Thumby Color screen
+_DEFAULT_SIZE = 128
+
+def request_display_config(width: int = None, height: int = None, color_depth: int = None) -> None:
+    if width is None or height is None:
+        width = height = _DEFAULT_SIZE
+    supervisor.runtime.display = displayio.Display(width, height)
+
+class _Audio:
+
+    def __init__(self):
+        self.playing = False
+        self._sample = None
+
+    def play(self, sample: object, *, loop: bool = False) -> None:
+        self._sample = sample
+        self.playing = True
+
+    def stop(self) -> None:
+        self._sample = None
+        self.playing = False
+
+class _DAC:
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+
+class Peripherals:
+
+    def __init__(self, audio_output: str = "headphone", safe_volume_limit: float = 0.75, sample_rate: int = 11025, bit_depth: int = 16, i2c: object = None):
+        self.dac = _DAC(sample_rate)
+        self.audio = _Audio()
+        self.audio_output = audio_output
+        self.safe_volume_limit = safe_volume_limit
+        self.volume = 0.7
+
+    def deinit(self) -> None:
+        self.audio.stop()
@@ -0,0 +1,16 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import wave
+
+class WaveFile:
+
+    def __init__(self, file: str, buffer: bytearray = None):
+        with wave.open(file, "rb") as f:
+            self.sample_rate = f.getframerate()
+            self.channel_count = f.getnchannels()
+            self.bits_per_sample = f.getsampwidth() * 8
+            self._frames = f.getnframes()
+
+    def deinit(self) -> None:
+        pass
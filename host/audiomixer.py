@@ -0,0 +1,36 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+class MixerVoice:
+
+    def __init__(self):
+        self.level = 1.0
+        self.loop = False
+        self._sample = None
+
+    def play(self, sample: object, *, loop: bool = False) -> None:
+        self._sample = sample
+        self.loop = loop
+
+    def stop(self) -> None:
+        self._sample = None
+
+    @property
+    def playing(self) -> bool:
+        # nothing is actually rendered, so only looping voices keep playing
+        return self._sample is not None and self.loop
+
+class Mixer:
+
+    def __init__(self, voice_count: int = 2, buffer_size: int = 1024, channel_count: int = 2, bits_per_sample: int = 16, samples_signed: bool = True, sample_rate: int = 8000):
+        self.voice = tuple(MixerVoice() for i in range(voice_count))
+        self.buffer_size = buffer_size
+        self.sample_rate = sample_rate
+
+    @property
+    def playing(self) -> bool:
+        return any(voice.playing for voice in self.voice)
+
+    def deinit(self) -> None:
+        self.voice = ()
@@ -0,0 +1,82 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import math
+
+def fill_region(dest_bitmap: object, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    x1, x2 = max(min(x1, x2), 0), min(max(x1, x2), dest_bitmap.width)
+    y1, y2 = max(min(y1, y2), 0), min(max(y1, y2), dest_bitmap.height)
+    data, width = dest_bitmap._data, dest_bitmap.width
+    for y in range(y1, y2):
+        for i in range(y * width + x1, y * width + x2):
+            data[i] = value
+
+def blit(dest_bitmap: object, source_bitmap: object, x: int, y: int, *, x1: int = 0, y1: int = 0, x2: int = None, y2: int = None, skip_source_index: int = None, skip_dest_index: int = None) -> None:
+    if x2 is None:
+        x2 = source_bitmap.width
+    if y2 is None:
+        y2 = source_bitmap.height
+    source, dest = source_bitmap._data, dest_bitmap._data
+    sw, dw, dh = source_bitmap.width, dest_bitmap.width, dest_bitmap.height
+    for j in range(y2 - y1):
+        dy = y + j
+        if not 0 <= dy < dh:
+            continue
+        for i in range(x2 - x1):
+            dx = x + i
+            if not 0 <= dx < dw:
+                continue
+            value = source[(y1 + j) * sw + x1 + i]
+            if value == skip_source_index:
+                continue
+            if skip_dest_index is not None and dest[dy * dw + dx] == skip_dest_index:
+                continue
+            dest[dy * dw + dx] = value
+
+def rotozoom(dest_bitmap: object, source_bitmap: object, *, ox: int = None, oy: int = None, dest_clip0: tuple = None, dest_clip1: tuple = None, px: int = None, py: int = None, source_clip0: tuple = None, source_clip1: tuple = None, angle: float = 0.0, scale: float = 1.0, skip_index: int = None) -> None:
+    # inverse-maps each destination pixel, positive angles rotate clockwise
+    if ox is None:
+        ox = dest_bitmap.width // 2
+    if oy is None:
+        oy = dest_bitmap.height // 2
+    if px is None:
+        px = source_bitmap.width // 2
+    if py is None:
+        py = source_bitmap.height // 2
+    dx0, dy0 = dest_clip0 if dest_clip0 else (0, 0)
+    dx1, dy1 = dest_clip1 if dest_clip1 else (dest_bitmap.width, dest_bitmap.height)
+    sx0, sy0 = source_clip0 if source_clip0 else (0, 0)
+    sx1, sy1 = source_clip1 if source_clip1 else (source_bitmap.width, source_bitmap.height)
+    dx0, dy0 = max(dx0, 0), max(dy0, 0)
+    dx1, dy1 = min(dx1, dest_bitmap.width), min(dy1, dest_bitmap.height)
+    cos, sin = math.cos(angle) / scale, math.sin(angle) / scale
+    source, dest = source_bitmap._data, dest_bitmap._data
+    sw, dw = source_bitmap.width, dest_bitmap.width
+    for y in range(dy0, dy1):
+        for x in range(dx0, dx1):
+            rx, ry = x - ox, y - oy
+            sx = math.floor(rx * cos + ry * sin + px)
+            sy = math.floor(-rx * sin + ry * cos + py)
+            if not (sx0 <= sx < sx1 and sy0 <= sy < sy1):
+                continue
+            value = source[sy * sw + sx]
+            if value == skip_index:
+                continue
+            dest[y * dw + x] = value
+
+def draw_line(dest_bitmap: object, x1: int, y1: int, x2: int, y2: int, value: int) -> None:
+    dx, dy = abs(x2 - x1), -abs(y2 - y1)
+    step_x, step_y = (1 if x1 < x2 else -1), (1 if y1 < y2 else -1)
+    error = dx + dy
+    while True:
+        if 0 <= x1 < dest_bitmap.width and 0 <= y1 < dest_bitmap.height:
+            dest_bitmap[x1, y1] = value
+        if x1 == x2 and y1 == y2:
+            break
+        e2 = 2 * error
+        if e2 >= dy:
+            error += dy
+            x1 += step_x
+        if e2 <= dx:
+            error += dx
+            y1 += step_y
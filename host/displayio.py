@@ -0,0 +1,398 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+from array import array
+import time
+
+class Colorspace:
+    RGB888 = 0
+    RGB565 = 1
+    RGB565_SWAPPED = 2
+    RGB555 = 3
+    RGB555_SWAPPED = 4
+    BGR565 = 5
+    BGR565_SWAPPED = 6
+    BGR555 = 7
+    BGR555_SWAPPED = 8
+    L8 = 9
+
+def _get_bits_per_value(value_count: int) -> int:
+    bits = 1
+    while (1 << bits) < value_count:
+        bits <<= 1
+    return bits
+
+class Bitmap:
+
+    def __init__(self, width: int, height: int, value_count: int):
+        if width < 0 or height < 0:
+            raise ValueError("invalid size")
+        self._width, self._height = width, height
+        self._bits_per_value = _get_bits_per_value(value_count)
+        self._max = (1 << self._bits_per_value) - 1
+        typecode = "B" if self._bits_per_value <= 8 else ("H" if self._bits_per_value <= 16 else "L")
+        self._data = array(typecode, bytes(width * height * array(typecode).itemsize))
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def bits_per_value(self) -> int:
+        return self._bits_per_value
+
+    def _index(self, index: int|tuple) -> int:
+        if isinstance(index, tuple):
+            x, y = index
+            if not (0 <= x < self._width and 0 <= y < self._height):
+                raise IndexError("pixel coordinates out of bounds")
+            return y * self._width + x
+        return index
+
+    def __getitem__(self, index: int|tuple) -> int:
+        return self._data[self._index(index)]
+
+    def __setitem__(self, index: int|tuple, value: int) -> None:
+        if not 0 <= value <= self._max:
+            raise ValueError("pixel value out of range")
+        self._data[self._index(index)] = value
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def fill(self, value: int) -> None:
+        for i in range(len(self._data)):
+            self._data[i] = value
+
+    def dirty(self, x1: int = 0, y1: int = 0, x2: int = -1, y2: int = -1) -> None:
+        pass
+
+def _rgb888(value: int|tuple|bytes) -> int:
+    if isinstance(value, int):
+        return value & 0xFFFFFF
+    r, g, b = value[0:3]
+    return (r << 16) | (g << 8) | b
+
+class Palette:
+
+    def __init__(self, color_count: int, *, dither: bool = False):
+        self._colors = [0] * color_count
+        self._transparent = [False] * color_count
+        self.dither = dither
+
+    def __len__(self) -> int:
+        return len(self._colors)
+
+    def __getitem__(self, index: int) -> int:
+        return self._colors[index]
+
+    def __setitem__(self, index: int, value: int|tuple|bytes) -> None:
+        self._colors[index] = _rgb888(value)
+
+    def make_transparent(self, index: int) -> None:
+        self._transparent[index] = True
+
+    def make_opaque(self, index: int) -> None:
+        self._transparent[index] = False
+
+    def is_transparent(self, index: int) -> bool:
+        return self._transparent[index]
+
+    def _color(self, value: int) -> int:
+        if value >= len(self._colors) or self._transparent[value]:
+            return None
+        return self._colors[value]
+
+class ColorConverter:
+
+    def __init__(self, *, input_colorspace: int = Colorspace.RGB888, dither: bool = False):
+        self._colorspace = input_colorspace
+        self._transparent = None
+        self.dither = dither
+
+    def convert(self, color: int) -> int:
+        # converts from the input colorspace to RGB565
+        color = self._rgb888(color)
+        return ((color >> 8) & 0xF800) | ((color >> 5) & 0x07E0) | ((color >> 3) & 0x001F)
+
+    def make_transparent(self, color: int) -> None:
+        if self._transparent is not None and self._transparent != color:
+            raise RuntimeError("Only one color can be transparent at a time")
+        self._transparent = color
+
+    def make_opaque(self, color: int) -> None:
+        self._transparent = None
+
+    def _color(self, value: int) -> int:
+        if value == self._transparent:
+            return None
+        return self._rgb888(value)
+
+    def _rgb888(self, value: int) -> int:
+        space = self._colorspace
+        if space in (Colorspace.RGB565_SWAPPED, Colorspace.RGB555_SWAPPED, Colorspace.BGR565_SWAPPED, Colorspace.BGR555_SWAPPED):
+            value = ((value & 0xFF) << 8) | ((value >> 8) & 0xFF)
+        if space in (Colorspace.RGB565, Colorspace.RGB565_SWAPPED, Colorspace.BGR565, Colorspace.BGR565_SWAPPED):
+            r, g, b = (value >> 11) & 0x1F, (value >> 5) & 0x3F, value & 0x1F
+            r, g, b = (r << 3) | (r >> 2), (g << 2) | (g >> 4), (b << 3) | (b >> 2)
+        elif space in (Colorspace.RGB555, Colorspace.RGB555_SWAPPED, Colorspace.BGR555, Colorspace.BGR555_SWAPPED):
+            r, g, b = (value >> 10) & 0x1F, (value >> 5) & 0x1F, value & 0x1F
+            r, g, b = (r << 3) | (r >> 2), (g << 3) | (g >> 2), (b << 3) | (b >> 2)
+        elif space == Colorspace.L8:
+            r = g = b = value & 0xFF
+        else:
+            return value & 0xFFFFFF
+        if space in (Colorspace.BGR565, Colorspace.BGR565_SWAPPED, Colorspace.BGR555, Colorspace.BGR555_SWAPPED):
+            r, b = b, r
+        return (r << 16) | (g << 8) | b
+
+class _Layer:
+    # shared base for objects which can only belong to a single group
+
+    def __init__(self, x: int = 0, y: int = 0):
+        self._x, self._y = int(x), int(y)
+        self._hidden = False
+        self._in_group = False
+
+    @property
+    def x(self) -> int:
+        return self._x
+
+    @x.setter
+    def x(self, value: int) -> None:
+        self._x = int(value)
+
+    @property
+    def y(self) -> int:
+        return self._y
+
+    @y.setter
+    def y(self, value: int) -> None:
+        self._y = int(value)
+
+    @property
+    def hidden(self) -> bool:
+        return self._hidden
+
+    @hidden.setter
+    def hidden(self, value: bool) -> None:
+        self._hidden = bool(value)
+
+class TileGrid(_Layer):
+
+    def __init__(self, bitmap: Bitmap, *, pixel_shader: Palette|ColorConverter, width: int = 1, height: int = 1, tile_width: int = None, tile_height: int = None, default_tile: int = 0, x: int = 0, y: int = 0):
+        super().__init__(x, y)
+        if tile_width is None:
+            tile_width = bitmap.width
+        if tile_height is None:
+            tile_height = bitmap.height
+        if not tile_width or bitmap.width % tile_width:
+            raise ValueError("Tile width must exactly divide bitmap width")
+        if not tile_height or bitmap.height % tile_height:
+            raise ValueError("Tile height must exactly divide bitmap height")
+        self._bitmap = bitmap
+        self.pixel_shader = pixel_shader
+        self._width, self._height = width, height
+        self._tile_width, self._tile_height = tile_width, tile_height
+        self._tiles = array("H", [default_tile] * (width * height))
+        self.flip_x = False
+        self.flip_y = False
+        self.transpose_xy = False
+
+    @property
+    def bitmap(self) -> Bitmap:
+        return self._bitmap
+
+    @bitmap.setter
+    def bitmap(self, value: Bitmap) -> None:
+        if value.width != self._bitmap.width or value.height != self._bitmap.height:
+            raise ValueError("New bitmap must be same size as old bitmap")
+        self._bitmap = value
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def tile_width(self) -> int:
+        return self._tile_width
+
+    @property
+    def tile_height(self) -> int:
+        return self._tile_height
+
+    def _index(self, index: int|tuple) -> int:
+        if isinstance(index, tuple):
+            return index[1] * self._width + index[0]
+        return index
+
+    def __getitem__(self, index: int|tuple) -> int:
+        return self._tiles[self._index(index)]
+
+    def __setitem__(self, index: int|tuple, value: int) -> None:
+        self._tiles[self._index(index)] = value
+
+    def _draw(self, buffer: bytearray, stride: int, rows: int, ox: int, oy: int, scale: int) -> None:
+        bitmap, shader = self._bitmap, self.pixel_shader
+        tw, th = self._tile_width, self._tile_height
+        columns = bitmap.width // tw
+        data, bw = bitmap._data, bitmap.width
+        ox += self._x * scale
+        oy += self._y * scale
+        pixels = {}  # value -> (r, g, b), or None when transparent
+        for ty in range(self._height):
+            for tx in range(self._width):
+                tile = self._tiles[ty * self._width + tx]
+                sx, sy = (tile % columns) * tw, (tile // columns) * th
+                for j in range(th):
+                    py = oy + (ty * th + j) * scale
+                    if py + scale <= 0 or py >= rows:
+                        continue
+                    y0, y1 = max(py, 0), min(py + scale, rows)
+                    row = (sy + (th - 1 - j if self.flip_y else j)) * bw + sx
+                    for i in range(tw):
+                        px = ox + (tx * tw + i) * scale
+                        if px + scale <= 0 or px >= stride:
+                            continue
+                        value = data[row + (tw - 1 - i if self.flip_x else i)]
+                        if value in pixels:
+                            pixel = pixels[value]
+                        else:
+                            color = shader._color(value)
+                            pixel = pixels[value] = None if color is None else (color >> 16, (color >> 8) & 0xFF, color & 0xFF)
+                        if pixel is None:
+                            continue
+                        r, g, b = pixel
+                        x0, x1 = max(px, 0), min(px + scale, stride)
+                        for dy in range(y0, y1):
+                            offset = (dy * stride + x0) * 3
+                            for dx in range(x1 - x0):
+                                buffer[offset] = r
+                                buffer[offset + 1] = g
+                                buffer[offset + 2] = b
+                                offset += 3
+
+class Group(_Layer):
+
+    def __init__(self, *, scale: int = 1, x: int = 0, y: int = 0):
+        _Layer.__init__(self, x, y)
+        if scale < 1:
+            raise ValueError("scale must be >= 1")
+        self._scale = int(scale)
+        self._layers = []
+
+    @property
+    def scale(self) -> int:
+        return self._scale
+
+    @scale.setter
+    def scale(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("scale must be >= 1")
+        self._scale = int(value)
+
+    def _claim(self, layer: _Layer) -> None:
+        if layer._in_group:
+            raise ValueError("Layer already in a group")
+        layer._in_group = True
+
+    def append(self, layer: _Layer) -> None:
+        self._claim(layer)
+        self._layers.append(layer)
+
+    def insert(self, index: int, layer: _Layer) -> None:
+        self._claim(layer)
+        self._layers.insert(index, layer)
+
+    def index(self, layer: _Layer) -> int:
+        return self._layers.index(layer)
+
+    def pop(self, i: int = -1) -> _Layer:
+        layer = self._layers.pop(i)
+        layer._in_group = False
+        return layer
+
+    def remove(self, layer: _Layer) -> None:
+        self._layers.remove(layer)
+        layer._in_group = False
+
+    def sort(self, key: object = None, reverse: bool = False) -> None:
+        self._layers.sort(key=key, reverse=reverse)
+
+    def __len__(self) -> int:
+        return len(self._layers)
+
+    def __getitem__(self, index: int) -> _Layer:
+        return self._layers[index]
+
+    def __setitem__(self, index: int, layer: _Layer) -> None:
+        self._claim(layer)
+        self._layers[index]._in_group = False
+        self._layers[index] = layer
+
+    def __delitem__(self, index: int) -> None:
+        self.pop(index)
+
+    def __contains__(self, layer: _Layer) -> bool:
+        return any(item is layer for item in self._layers)
+
+    def __iter__(self):
+        return iter(self._layers)
+
+    def _draw(self, buffer: bytearray, stride: int, rows: int, ox: int, oy: int, scale: int) -> None:
+        ox += self._x * scale
+        oy += self._y * scale
+        scale *= self._scale
+        for layer in self._layers:
+            if not layer._hidden:
+                layer._draw(buffer, stride, rows, ox, oy, scale)
+
+class Display:
+    # in-memory RGB888 framebuffer standing in for `busdisplay`/`framebufferio` displays
+
+    def __init__(self, width: int, height: int, pace: bool = False):
+        self.width, self.height = width, height
+        self.root_group = None
+        self.auto_refresh = True
+        self.pace = pace
+        self.render = True
+        self.refresh_count = 0
+        self.buffer = bytearray(width * height * 3)
+        self._last_refresh = None
+
+    def refresh(self, *, target_frames_per_second: int = None, minimum_frames_per_second: int = 0) -> bool:
+        if self.pace and target_frames_per_second and self._last_refresh is not None:
+            remaining = 1 / target_frames_per_second - (time.monotonic() - self._last_refresh)
+            if remaining > 0:
+                time.sleep(remaining)
+        self._last_refresh = time.monotonic()
+        self.refresh_count += 1
+        if not self.render:
+            return True
+        self.buffer[:] = bytes(len(self.buffer))
+        if self.root_group is not None and not self.root_group.hidden:
+            self.root_group._draw(self.buffer, self.width, self.height, 0, 0, 1)
+        return True
+
+    def pixel(self, x: int, y: int) -> int:
+        offset = (y * self.width + x) * 3
+        return (self.buffer[offset] << 16) | (self.buffer[offset + 1] << 8) | self.buffer[offset + 2]
+
+    def save(self, path: str) -> None:
+        # binary PPM, viewable with most image tools
+        with open(path, "wb") as f:
+            f.write(f"P6 {self.width} {self.height} 255\n".encode())
+            f.write(self.buffer)
+
+CIRCUITPYTHON_TERMINAL = Group()
+
+def release_displays() -> None:
+    pass
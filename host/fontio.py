@@ -0,0 +1,15 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+
+class Glyph:
+
+    def __init__(self, bitmap: object, tile_index: int, width: int, height: int, dx: int, dy: int, shift_x: int, shift_y: int):
+        self.bitmap = bitmap
+        self.tile_index = tile_index
+        self.width, self.height = width, height
+        self.dx, self.dy = dx, dy
+        self.shift_x, self.shift_y = shift_x, shift_y
+
+class FontProtocol:
+    pass
@@ -0,0 +1,66 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+BUTTON_A = 0
+BUTTON_B = 1
+BUTTON_X = 2
+BUTTON_Y = 3
+BUTTON_UP = 4
+BUTTON_DOWN = 5
+BUTTON_LEFT = 6
+BUTTON_RIGHT = 7
+BUTTON_L1 = 8
+BUTTON_R1 = 9
+BUTTON_L2 = 10
+BUTTON_R2 = 11
+BUTTON_L3 = 12
+BUTTON_R3 = 13
+BUTTON_START = 14
+BUTTON_SELECT = 15
+BUTTON_HOME = 16
+BUTTON_JOYSTICK_UP = 17
+BUTTON_JOYSTICK_DOWN = 18
+BUTTON_JOYSTICK_LEFT = 19
+BUTTON_JOYSTICK_RIGHT = 20
+
+BUTTON_NAMES = (
+    "A", "B", "X", "Y",
+    "UP", "DOWN", "LEFT", "RIGHT",
+    "L1", "R1", "L2", "R2", "L3", "R3",
+    "START", "SELECT", "HOME",
+    "JOYSTICK_UP", "JOYSTICK_DOWN", "JOYSTICK_LEFT", "JOYSTICK_RIGHT",
+)
+
+class Event:
+
+    def __init__(self, key_number: int, pressed: bool):
+        self.key_number = key_number
+        self.pressed = pressed
+        self.released = not pressed
+
+class Buttons:
+
+    def __init__(self):
+        for name in BUTTON_NAMES:
+            setattr(self, name, False)
+
+class Gamepad:
+    # no USB host on the desktop, button changes are injected with `_set_button`
+
+    def __init__(self, port: int = None):
+        self.connected = False
+        self.buttons = Buttons()
+        self.events = []
+        self._device = None
+        self._pending = []
+
+    def _set_button(self, button: int, pressed: bool) -> None:
+        self.connected = True
+        self._pending.append(Event(button, pressed))
+
+    def update(self) -> bool:
+        self.events = self._pending
+        self._pending = []
+        for event in self.events:
+            setattr(self.buttons, BUTTON_NAMES[event.key_number], event.pressed)
+        return bool(self.events)
@@ -0,0 +1,110 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+from __future__ import annotations
+import __future__
+import argparse
+import gc
+import importlib.machinery
+import os
+import sys
+import tracemalloc
+
+HOST_PATH = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HOST_PATH)
+ENGINE_PATH = os.path.join(ROOT, "engine")
+
+HEAP_SIZE = 8 * 1024 * 1024  # Fruit Jam PSRAM heap
+
+_source_paths = set()
+
+def _compile(source: bytes|str, path: str) -> object:
+    # MicroPython never evaluates annotations, so engine and game code use forward references freely
+    return compile(source, path, "exec", flags=__future__.annotations.compiler_flag, dont_inherit=True)
+
+class _SourceLoader(importlib.machinery.SourceFileLoader):
+
+    def get_code(self, fullname: str) -> object:
+        path = self.get_filename(fullname)
+        return _compile(self.get_data(path), path)
+
+def _path_hook(path: str) -> object:
+    if os.path.abspath(path) not in _source_paths:
+        raise ImportError
+    return importlib.machinery.FileFinder(path, (_SourceLoader, importlib.machinery.SOURCE_SUFFIXES))
+
+def add_source_path(path: str) -> None:
+    path = os.path.abspath(path)
+    if _path_hook not in sys.path_hooks:
+        sys.path_hooks.insert(0, _path_hook)
+    _source_paths.add(path)
+    sys.path_importer_cache.pop(path, None)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+def run_file(path: str) -> None:
+    with open(path) as f:
+        code = _compile(f.read(), path)
+    exec(code, {"__name__": "__main__", "__file__": path})
+
+def _mem_alloc() -> int:
+    # only measured while tracing, which slows the interpreter down considerably
+    return tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+
+def _mem_free() -> int:
+    return max(HEAP_SIZE - _mem_alloc(), 0)
+
+def setup(cwd: str = None) -> None:
+    # CPython has no fixed heap, so report allocations against a nominal CircuitPython one
+    if not hasattr(gc, "mem_free"):
+        gc.mem_alloc = _mem_alloc
+        gc.mem_free = _mem_free
+
+    # host stand-ins must shadow any installed CircuitPython compatibility layers
+    add_source_path(ENGINE_PATH)
+    if HOST_PATH in sys.path:
+        sys.path.remove(HOST_PATH)
+    sys.path.insert(0, HOST_PATH)
+    if cwd is not None:
+        add_source_path(cwd)
+        os.chdir(cwd)
+
+    import engine_main
+    engine_main._init()
+
+def limit_frames(count: int) -> None:
+    import engine
+    tick = engine.tick
+    frames = 0
+    def limited_tick() -> bool:
+        nonlocal frames
+        frames += 1
+        if frames > count:
+            raise SystemExit
+        return tick()
+    engine.tick = limited_tick
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run a Thumby Color game headless on the host")
+    parser.add_argument("game", help="path to the game directory containing main.py")
+    parser.add_argument("--frames", type=int, default=300, help="number of engine ticks to run")
+    parser.add_argument("--screenshot", help="write the final frame to this PPM file")
+    args = parser.parse_args()
+
+    game = os.path.abspath(args.game)
+    screenshot = os.path.abspath(args.screenshot) if args.screenshot else None
+    setup(game)
+    limit_frames(args.frames)
+
+    try:
+        run_file(os.path.join(game, "main.py"))
+    except SystemExit:
+        pass
+
+    if screenshot:
+        import engine_main
+        engine_main._display.refresh()
+        engine_main._display.save(screenshot)
+
+if __name__ == "__main__":
+    main()
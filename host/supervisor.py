@@ -0,0 +1,25 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import time
+
+class _Runtime:
+
+    def __init__(self):
+        self.display = None
+        self.autoreload = False
+        self.serial_bytes_available = 0
+
+runtime = _Runtime()
+
+_TICKS_PERIOD = 1 << 29
+_start = time.monotonic_ns()
+
+def ticks_ms() -> int:
+    return ((time.monotonic_ns() - _start) // 1000000) % _TICKS_PERIOD
+
+def reload() -> None:
+    raise SystemExit
+
+def set_next_code_file(filename: str, *, reload_on_success: bool = False, reload_on_error: bool = False, sticky_on_success: bool = False, sticky_on_error: bool = False, sticky_on_reload: bool = False) -> None:
+    pass
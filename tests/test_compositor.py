@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "host"))
+import run
+if "engine_main" not in sys.modules:
+    run.setup()  # shared by every test module, nodes keep references to the first display
+
+import compositor
+import engine_draw
+import engine_main
+from engine_nodes import Circle2DNode, Line2DNode, Rectangle2DNode, Sprite2DNode, Text2DNode
+from engine_resources import FontResource, TextureResource, _blend
+
+ASSETS = os.path.relpath(os.path.join(ROOT, "filesystem", "system", "assets"))  # absolute paths are mapped into the game
+
+class SourceCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        compositor.enable()
+
+    def tearDown(self):
+        compositor.disable()
+
+    def circle(self, **kwargs) -> Circle2DNode:
+        node = Circle2DNode(radius=4, **kwargs)
+        self.addCleanup(node.mark_destroy)
+        return node
+
+    def test_same_colors_share_source(self):
+        circles = [self.circle(position=(i - 50, 0), color=0xFF0000) for i in range(100)]
+        compositor._render()
+        self.assertEqual(len(compositor._sources), 1)
+        source = compositor._get_source(circles[0]._tg.bitmap, circles[0]._palette)
+        compositor._render()
+        self.assertIs(compositor._get_source(circles[-1]._tg.bitmap, circles[-1]._palette), source)
+
+    def test_fade_converts_in_place(self):
+        circle = self.circle(color=0xFFFFFF)
+        bitmap, center = circle._tg.bitmap, 4 * 9 + 4
+        compositor._render()
+        circle.opacity = 0.5
+        compositor._render()
+        source = compositor._get_source(bitmap, circle._palette)
+        count = len(compositor._sources)
+        for opacity in (0.4, 0.3, 0.2):
+            circle.opacity = opacity
+            compositor._render()
+            self.assertIs(compositor._get_source(bitmap, circle._palette), source)
+            self.assertEqual(source[center], compositor._rgb565(_blend(0xFFFFFF, engine_main._bg_palette[0], opacity)))
+        self.assertEqual(len(compositor._sources), count)
+
+    def test_invalidate_bitmap(self):
+        circle = self.circle(color=0xFFFFFF)
+        compositor._render()
+        source = compositor._get_source(circle._tg.bitmap, circle._palette)
+        compositor.invalidate(circle._tg.bitmap)
+        self.assertEqual(len(compositor._sources), 0)
+        compositor._render()
+        self.assertIsNot(compositor._get_source(circle._tg.bitmap, circle._palette), source)
+
+class RenderTest(unittest.TestCase):
+
+    def setUp(self):
+        engine_draw.set_background_color(0x2188)
+        texture = TextureResource(os.path.join(ASSETS, "outrunner_outline.bmp"))
+        font = FontResource(os.path.join(ASSETS, "font5x7.bmp"))
+        self.nodes = [
+            Rectangle2DNode(position=(-40, -40), width=30, height=12, color=0xF800),
+            Rectangle2DNode(position=(-40, -20), width=20, height=20, color=0x07E0, outline=True),
+            Circle2DNode(position=(30, -30), radius=12, color=0xFFE0, opacity=0.5),
+            Line2DNode(start=(-60, 50), end=(60, 20), color=0x07FF, thickness=2),
+            Sprite2DNode(position=(0, 10), texture=texture, transparent_color=0, frame_count_x=76, playing=False, scale=2),
+            Text2DNode(position=(20, 40), font=font, text="Score 42", color=0xFC00),
+        ]
+
+    def tearDown(self):
+        compositor.disable()
+        engine_draw.set_background_color(0x000000)
+        for node in self.nodes:
+            node.mark_destroy_all()
+
+    def frame(self) -> bytes:
+        # the compositor stores RGB565, so both frames are compared at that depth
+        display = engine_main._display
+        if compositor._enabled:
+            compositor._render()
+        display.refresh()
+        return bytes(value >> (2 if i % 3 == 1 else 3) for i, value in enumerate(display.buffer))
+
+    def test_matches_displayio(self):
+        expected = self.frame()
+        compositor.enable()
+        self.assertEqual(self.frame(), expected)
+
+if __name__ == "__main__":
+    unittest.main()
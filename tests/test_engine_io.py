@@ -0,0 +1,102 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import os
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "host"))
+import run
+if "engine_main" not in sys.modules:
+    run.setup()  # shared by every test module, nodes keep references to the first display
+
+import engine
+import engine_io
+import relic_usb_host_gamepad
+from engine_nodes import EmptyNode
+
+# button changes injected before each frame, as (button, pressed)
+PRESSES = (
+    (),
+    ((relic_usb_host_gamepad.BUTTON_A, True),),
+    (),
+    ((relic_usb_host_gamepad.BUTTON_RIGHT, True),),
+    ((relic_usb_host_gamepad.BUTTON_A, False),),
+    ((relic_usb_host_gamepad.BUTTON_RIGHT, False), (relic_usb_host_gamepad.BUTTON_B, True)),
+    ((relic_usb_host_gamepad.BUTTON_B, False),),
+)
+
+class Ticks(EmptyNode):
+
+    def __init__(self):
+        super().__init__()
+        self.dts = []
+
+    def tick(self, dt: float) -> None:
+        self.dts.append(dt)
+
+class RecordReplayTest(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "input.bin")
+
+    def tearDown(self):
+        engine_io.stop()
+
+    def state(self) -> tuple:
+        return tuple((button.is_pressed, button.is_just_pressed, button.is_just_released) for button in (engine_io.A, engine_io.B, engine_io.RIGHT))
+
+    def test_round_trip(self):
+        engine_io.record(self.path, 1 / 16)
+        recorded = []
+        for changes in PRESSES:
+            for button, pressed in changes:
+                engine_io._gamepad._set_button(button, pressed)
+            engine_io._tick()
+            recorded.append(self.state())
+        engine_io.stop()
+        self.assertTrue(any(state[0][0] for state in recorded))
+
+        # live input is ignored while replaying
+        engine_io.replay(self.path)
+        replayed = []
+        for changes in PRESSES:
+            engine_io._gamepad._set_button(relic_usb_host_gamepad.BUTTON_B, True)
+            engine_io._tick()
+            replayed.append(self.state())
+        self.assertEqual(replayed, recorded)
+        self.assertTrue(engine_io.is_replaying())
+
+        # the recording has run out, so input is live again
+        engine_io._gamepad._set_button(relic_usb_host_gamepad.BUTTON_B, False)
+        engine_io._tick()
+        self.assertFalse(engine_io.is_replaying())
+        self.assertIsNone(engine_io._frame_dt)
+
+    def test_replay_ticks_at_recorded_step(self):
+        engine_io.record(self.path, 1 / 16)
+        for i in range(3):
+            engine_io._tick()
+        engine_io.stop()
+
+        engine.tick()  # nodes are only ticked once a previous frame has been timed
+        node = Ticks()
+        self.addCleanup(node.mark_destroy)
+        engine_io.replay(self.path)
+        for i in range(3):
+            engine.tick()
+        self.assertEqual(node.dts, [1 / 16] * 3)
+
+    def test_invalid_recording(self):
+        with open(self.path, "wb") as f:
+            f.write(b"\0" * 16)
+        with self.assertRaises(ValueError):
+            engine_io.replay(self.path)
+        self.assertFalse(engine_io.is_replaying())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "host"))
+import run
+if "engine_main" not in sys.modules:
+    run.setup()  # shared by every test module, nodes keep references to the first display
+
+import engine_main
+import engine_nodes
+from engine_nodes import CameraNode, EmptyNode, Rectangle2DNode, Text2DNode
+from engine_resources import _blend
+
+class TextLabelTest(unittest.TestCase):
+
+    def setUp(self):
+        engine_nodes.set_pool_limit(4)
+
+    def tearDown(self):
+        engine_nodes.set_pool_limit(0)
+
+    def text(self, **kwargs) -> Text2DNode:
+        node = Text2DNode(**kwargs)
+        self.addCleanup(node.mark_destroy)
+        return node
+
+    def test_pooled_label_is_white(self):
+        Text2DNode(text="fresh").mark_destroy()
+        self.assertEqual(self.text(text="pooled")._label.color, 0xFFFFFF)
+
+    def test_opacity_without_color(self):
+        # the first label is fresh, the second is taken from the pool once the first is destroyed
+        for i in range(2):
+            text = self.text(text="fade", opacity=0.5)
+            self.assertEqual(text._label.color, _blend(0xFFFFFF, engine_main._bg_palette[0], 0.5))
+            text.opacity = 1
+            self.assertEqual(text._label.color, 0xFFFFFF)
+            text.mark_destroy()
+
+class CameraTest(unittest.TestCase):
+
+    def test_last_camera_resets_view(self):
+        camera = CameraNode(position=(40, -20), zoom=2)
+        group = engine_main._layer_group
+        self.assertEqual((group.x, group.y, group.scale), (-80, 40, 2))
+        camera.mark_destroy()
+        self.assertEqual((group.x, group.y, group.scale), (0, 0, 1))
+
+    def test_destroy_falls_back_to_older_camera(self):
+        first = CameraNode(position=(10, 0))
+        second = CameraNode(position=(40, 0), zoom=2)
+        second.mark_destroy()
+        self.assertIs(engine_nodes._camera, first)
+        self.assertEqual((engine_main._layer_group.x, engine_main._layer_group.scale), (-10, 1))
+        first.mark_destroy()
+        self.assertIsNone(engine_nodes._camera)
+
+class CullTest(unittest.TestCase):
+
+    def setUp(self):
+        self.near = Rectangle2DNode(position=(0, 0), width=10, height=10, color=0xFFFF)
+        self.far = Rectangle2DNode(position=(1000, 0), width=10, height=10, color=0xFFFF)
+        self.child = Rectangle2DNode(position=(1000, 0), width=4, height=4, color=0xFFFF)
+        self.parent = EmptyNode(position=(0, 500))
+        self.parent.add_child(self.child)
+        self.camera = CameraNode()
+
+    def tearDown(self):
+        for node in (self.camera, self.near, self.far, self.parent):
+            node.mark_destroy_all()
+
+    def test_hide_and_show(self):
+        engine_nodes._cull()
+        self.assertFalse(self.near._group.hidden)
+        self.assertTrue(self.far._group.hidden)
+
+        self.camera.position = (1000, 0)
+        engine_nodes._cull()
+        self.assertTrue(self.near._group.hidden)
+        self.assertFalse(self.far._group.hidden)
+
+    def test_child_follows_empty_parent(self):
+        engine_nodes._cull()
+        self.assertTrue(self.child._group.hidden)
+        self.parent.position = (-1000, 0)
+        engine_nodes._cull()
+        self.assertFalse(self.child._group.hidden)
+
+    def test_destroyed_camera_shows_everything(self):
+        engine_nodes._cull()
+        self.camera.mark_destroy()
+        for node in (self.near, self.far, self.child):
+            self.assertFalse(node._group.hidden)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 Cooper Dalrymple (@relic-se)
+#
+# SPDX-License-Identifier: GPLv3
+import os
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "host"))
+import run
+if "engine_main" not in sys.modules:
+    run.setup()  # shared by every test module, nodes keep references to the first display
+
+import engine_physics
+from engine_nodes import EmptyNode, PhysicsCircle2DNode, PhysicsRectangle2DNode, Rectangle2DNode
+
+def step(seconds: float) -> None:
+    for i in range(int(seconds * 60)):
+        engine_physics._tick(1 / 60)
+
+class QueryRayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes = []
+
+    def tearDown(self):
+        for node in self.nodes:
+            node.mark_destroy_all()
+
+    def circle(self, x: float, y: float, radius: float) -> PhysicsCircle2DNode:
+        node = PhysicsCircle2DNode(position=(x, y), radius=radius, dynamic=False)
+        self.nodes.append(node)
+        return node
+
+    def test_circle_behind_origin(self):
+        # close enough to the origin for its box to be queried, but the ray points away from it
+        self.circle(-1.75, 1.04, 2)
+        self.assertEqual(engine_physics.query_ray(0, 0, 1, 1, 50), [])
+
+    def test_circle_ahead(self):
+        circle = self.circle(20, 0, 2)
+        self.assertEqual(engine_physics.query_ray(0, 0, 1, 0, 50), [circle])
+        self.assertEqual(engine_physics.query_ray(0, 0, 1, 0, 10), [])
+
+    def test_origin_inside_circle(self):
+        circle = self.circle(1, 0, 2)
+        self.assertEqual(engine_physics.query_ray(0, 0, -1, 0, 50), [circle])
+
+class QueryGroupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes = []
+
+    def tearDown(self):
+        for node in self.nodes:
+            node.mark_destroy_all()
+
+    def test_group_with_children(self):
+        parent = Rectangle2DNode(position=(70, 70), width=10, height=10, color=0xFFFF)
+        child = Rectangle2DNode(position=(30, 0), width=4, height=4, color=0xFFFF)
+        parent.add_child(child)
+        self.nodes.append(parent)
+        self.assertEqual(engine_physics.query_point(70, 70), [parent])
+        self.assertEqual(engine_physics.query_point(100, 70), [child])
+
+        # children follow their parent
+        parent.position = (-70, 70)
+        self.assertEqual(engine_physics.query_point(100, 70), [])
+        self.assertEqual(engine_physics.query_point(-40, 70), [child])
+
+    def test_child_of_empty_node(self):
+        parent = EmptyNode(position=(200, 0))
+        child = Rectangle2DNode(position=(10, 0), width=4, height=4, color=0xFFFF)
+        parent.add_child(child)
+        self.nodes.append(parent)
+        self.assertEqual(engine_physics.query_point(210, 0), [child])
+        self.assertEqual(engine_physics.query_point(10, 0), [])
+
+        parent.position = (300, 0)
+        self.assertEqual(engine_physics.query_point(310, 0), [child])
+
+class StepTest(unittest.TestCase):
+
+    def setUp(self):
+        engine_physics.set_gravity(0, 200)
+        self.floor = PhysicsRectangle2DNode(position=(0, 100), width=200, height=10, dynamic=False)
+        self.boxes = [PhysicsRectangle2DNode(position=(0, 90 - i * 10), width=10, height=10, bounciness=0) for i in range(3)]
+
+    def tearDown(self):
+        engine_physics.set_gravity(0, 0)
+        for node in [self.floor] + self.boxes:
+            node.mark_destroy_all()
+        step(1 / 60)
+
+    def test_stack_sleeps(self):
+        step(2)
+        for box in self.boxes:
+            self.assertTrue(box.sleeping)
+            self.assertAlmostEqual(box.position.x, 0)
+        self.assertLess(self.boxes[0].position.y, 96)
+
+    def test_removal_wakes_stack(self):
+        step(2)
+        self.floor.mark_destroy_all()
+        heights = [box.position.y for box in self.boxes]
+        step(1 / 60)
+        for box in self.boxes:
+            self.assertFalse(box.sleeping)
+        step(0.5)
+        for box, height in zip(self.boxes, heights):
+            self.assertGreater(box.position.y, height + 10)
+
+    def test_removed_slots_are_reused(self):
+        step(1 / 60)
+        self.boxes[0].mark_destroy_all()
+        step(1 / 60)
+        capacity = len(engine_physics._flags)
+        self.assertEqual(len(engine_physics._nodes), 3)
+        self.assertEqual([box._body for box in self.boxes[1:]], [1, 2])
+
+        # the slot left by the removed box is reused instead of growing the arrays
+        box = PhysicsRectangle2DNode(position=(0, 0), width=10, height=10)
+        self.boxes[0] = box
+        self.assertEqual(box._body, 3)
+        self.assertEqual(len(engine_physics._flags), capacity)
+        self.assertFalse(box.sleeping)
+        self.assertEqual(box.velocity.y, 0)
+
+if __name__ == "__main__":
+    unittest.main()